@@ -1,15 +1,53 @@
 # build.py
 import PyInstaller.__main__
 import os
+import subprocess
+import sys
+
+# PyInstaller byte-compiles the bundle at the optimization level of the
+# interpreter running it, so re-run under -OO: asserts and docstrings are
+# stripped, giving smaller .pyc files and a faster import phase at launch
+if sys.flags.optimize < 2:
+    sys.exit(subprocess.call([sys.executable, '-OO'] + sys.argv))
+
+# Packages pulled in transitively (by hooks or optional imports) that the
+# app never uses; keeping them out shrinks the bundle and its extraction time
+unused_excludes = [
+    '--exclude-module=tkinter',
+    '--exclude-module=unittest',
+    '--exclude-module=pydoc',
+    '--exclude-module=scipy',
+    '--exclude-module=numpy.tests',
+    '--exclude-module=PyQt5.QtWebEngine',
+    '--exclude-module=PyQt5.QtWebEngineCore',
+    '--exclude-module=PyQt5.QtWebEngineWidgets',
+    '--exclude-module=PyQt5.QtQml',
+    '--exclude-module=PyQt5.QtQuick',
+    '--exclude-module=PyQt5.QtMultimedia',
+    '--exclude-module=PyQt5.QtMultimediaWidgets',
+    '--exclude-module=PyQt5.QtSql',
+    '--exclude-module=PyQt5.QtTest',
+]
+
+# Modules that only exist (or are only used) on another platform
+platform_excludes = []
+if sys.platform != 'win32':
+    platform_excludes.append('--exclude-module=winreg')
 
 PyInstaller.__main__.run([
     'main.py',
     '--name=SafeWarner',
-    '--onefile',
+    # onedir: the app ships unpacked, so launches (notably the boot-time
+    # --auto-mode --minimal start) skip the per-run temp extraction of onefile
+    '--onedir',
     '--windowed',
-    '--add-data=gui;gui',
-    '--add-data=core;core', 
-    '--add-data=utils;utils',
+    # No UPX: compressed binaries are decompressed on every launch
+    '--noupx',
+    # Use the repo's hook-mediapipe.py (face/pose assets only) instead of
+    # pyinstaller-hooks-contrib's, which collects every mediapipe data file
+    '--additional-hooks-dir=.',
+    # gui/, core/ and utils/ hold only Python modules, which PyInstaller
+    # collects through imports; add --add-data here only for real assets
     '--hidden-import=PyQt5.QtCore',
     '--hidden-import=PyQt5.QtGui',
     '--hidden-import=PyQt5.QtWidgets',
@@ -17,5 +55,7 @@ PyInstaller.__main__.run([
     '--hidden-import=cv2',
     '--hidden-import=numpy',
     '--hidden-import=psutil',
+    *unused_excludes,
+    *platform_excludes,
     '--clean'
 ])
\ No newline at end of file
@@ -1,12 +1,19 @@
 # build.spec
+# Build with `python -OO -m PyInstaller build.spec` so bundled bytecode has
+# asserts and docstrings stripped (matches build.py)
 import os
 import sys
 from PyInstaller.utils.hooks import collect_data_files
 from PyInstaller import __main__ as pyi
 
-# Collect all data files from mediapipe and other packages
-mediapipe_datas = collect_data_files('mediapipe')
-opencv_datas = collect_data_files('cv2')
+# Only the MediaPipe graphs/models behind FaceMesh and Pose (see hook-mediapipe.py);
+# opencv-python's runtime is picked up by PyInstaller's own cv2 hook
+mediapipe_datas = collect_data_files('mediapipe', includes=[
+    'modules/face_detection/*',
+    'modules/face_landmark/*',
+    'modules/pose_detection/*',
+    'modules/pose_landmark/*',
+])
 
 block_cipher = None
 
@@ -17,12 +24,7 @@ a = Analysis(
     datas=[
         # Include mediapipe data files
         *mediapipe_datas,
-        *opencv_datas,
-        
-        # Include your project folders
-        ('gui/', 'gui'),
-        ('core/', 'core'),
-        ('utils/', 'utils'),
+        # Project packages are collected as modules; list only non-Python assets here
     ],
     hiddenimports=[
         'mediapipe',
@@ -31,16 +33,30 @@ a = Analysis(
         'PyQt5.QtCore',
         'PyQt5.QtGui', 
         'PyQt5.QtWidgets',
-        'PyQt5.QtMultimedia',
-        'PyQt5.QtMultimediaWidgets',
         'psutil',
         'sys',
         'os',
     ],
-    hookspath=[],
+    hookspath=['.'],  # picks up the narrowed hook-mediapipe.py over the contrib one
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        # Unused packages pulled in transitively (keep in sync with build.py)
+        'tkinter',
+        'unittest',
+        'pydoc',
+        'scipy',
+        'numpy.tests',
+        'PyQt5.QtWebEngine',
+        'PyQt5.QtWebEngineCore',
+        'PyQt5.QtWebEngineWidgets',
+        'PyQt5.QtQml',
+        'PyQt5.QtQuick',
+        'PyQt5.QtMultimedia',
+        'PyQt5.QtMultimediaWidgets',
+        'PyQt5.QtSql',
+        'PyQt5.QtTest',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -49,20 +65,18 @@ a = Analysis(
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
+# onedir build: the EXE holds only the scripts and COLLECT lays out the
+# binaries/data next to it, so nothing is re-extracted on every launch
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='SafeWarner',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,  # Compress the executable (set to False if issues)
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx=False,  # UPX-packed binaries are decompressed on every launch
     console=False,  # Set to True if you need console window for debugging
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -70,4 +84,15 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
     icon=None,  # You can add an icon file here later
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='SafeWarner',
 )
\ No newline at end of file
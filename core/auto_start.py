@@ -4,143 +4,275 @@ Auto-start management for Safe Warner with enable/disable controls
 import os
 import sys
 import platform
-import subprocess
+import contextlib
+import time
 import warnings
+from typing import Optional
+
+# The platform never changes at runtime; resolve it once
+_SYSTEM = platform.system()
+
+# Registry access is only needed (and only importable) on Windows
+winreg = None
+if _SYSTEM == "Windows":
+    try:
+        import winreg
+    except ImportError:
+        winreg = None
 
 class AutoStartManager:
     """Manage auto-start at system boot"""
+
+    # No per-instance __dict__; every attribute is declared here
+    __slots__ = (
+        "app_name", "script_path", "_home",
+        "_plist_path", "_autostart_dir", "_desktop_path", "_bat_path",
+        "_launch_command", "_run_key_command",
+        "_bat_content", "_plist_content", "_desktop_content",
+        "_enabled_cache", "_enabled_cache_time",
+        "_enable", "_disable", "_check",
+    )
+
+    # Seconds a cached is_auto_start_enabled() result stays valid
+    CACHE_TTL = 5.0
+
+    # Per-user Windows key whose values are launched at logon
+    RUN_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
+
+    # Environment variables substituted into the Run-key command (most specific first)
+    EXPAND_VARS = ("LOCALAPPDATA", "APPDATA", "PROGRAMFILES", "USERPROFILE")
     
     def __init__(self, app_name="SafeWarner"):
         self.app_name = app_name
         self.script_path = os.path.abspath(sys.argv[0])
+        self._home = os.path.expanduser("~")
+        self._plist_path = os.path.join(self._home, "Library", "LaunchAgents",
+                                        f"com.{app_name.lower()}.plist")
+        self._autostart_dir = os.path.join(self._home, ".config", "autostart")
+        self._desktop_path = os.path.join(self._autostart_dir, f"{app_name}.desktop")
+        self._bat_path = os.path.join(os.getenv('APPDATA') or '',
+                                      'Microsoft', 'Windows', 'Start Menu', 'Programs', 'Startup',
+                                      f"{app_name}.bat")
+        self._enabled_cache = None
+        self._enabled_cache_time = 0.0
+
+        # Auto-start entries, rendered once per manager
+        self._launch_command = f'"{sys.executable}" "{self.script_path}" --auto-mode --minimal'
+        self._run_key_command = (f'"{self._expand_sz_path(sys.executable)}" '
+                                 f'"{self._expand_sz_path(self.script_path)}" --auto-mode --minimal')
+        self._bat_content = f'{self._launch_command}\n'
+        self._plist_content = self._render_plist()
+        self._desktop_content = self._render_desktop_entry()
+
+        # Platform handlers, selected once; None on unsupported platforms
+        self._enable = {
+            "Windows": self._enable_windows_auto_start,
+            "Darwin": self._enable_macos_auto_start,
+            "Linux": self._enable_linux_auto_start,
+        }.get(_SYSTEM)
+        self._disable = {
+            "Windows": self._disable_windows_auto_start,
+            "Darwin": self._disable_macos_auto_start,
+            "Linux": self._disable_linux_auto_start,
+        }.get(_SYSTEM)
+        self._check = {
+            "Windows": self._check_windows_auto_start,
+            "Darwin": self._check_macos_auto_start,
+            "Linux": self._check_linux_auto_start,
+        }.get(_SYSTEM)
+
+    def invalidate_cache(self):
+        """Forget the cached auto-start state (e.g. after an external change)"""
+        self._enabled_cache = None
+
+    def _expand_sz_path(self, path):
+        """Replace a leading well-known folder in path with its %VAR% reference"""
+        for var in self.EXPAND_VARS:
+            base = os.environ.get(var)
+            if base and path.lower().startswith(base.rstrip("\\").lower() + "\\"):
+                return f"%{var}%" + path[len(base.rstrip("\\")):]
+        return path
+
+    def _render_plist(self):
+        """Launch agent plist for macOS"""
+        return f'''<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>Label</key>
+    <string>com.{self.app_name.lower()}</string>
+    <key>ProgramArguments</key>
+    <array>
+        <string>{sys.executable}</string>
+        <string>{self.script_path}</string>
+        <string>--auto-mode</string>
+        <string>--minimal</string>
+    </array>
+    <key>RunAtLoad</key>
+    <true/>
+    <key>KeepAlive</key>
+    <false/>
+</dict>
+</plist>'''
+
+    def _render_desktop_entry(self):
+        """Autostart .desktop entry for Linux"""
+        return f'''[Desktop Entry]
+Type=Application
+Name={self.app_name}
+Exec={sys.executable} {self.script_path} --auto-mode --minimal
+Hidden=false
+NoDisplay=false
+X-GNOME-Autostart-enabled=true
+'''
         
     def set_auto_start(self, enabled: bool):
         """Enable or disable auto-start based on the flag"""
-        system = platform.system()
+        action = self._enable if enabled else self._disable
+        if action is None:
+            warnings.warn(f"Auto-start not supported on {_SYSTEM}")
+            return
         try:
-            if system == "Windows":
-                if enabled:
-                    self._enable_windows_auto_start()
-                else:
-                    self._disable_windows_auto_start()
-            elif system == "Darwin":
-                if enabled:
-                    self._enable_macos_auto_start()
-                else:
-                    self._disable_macos_auto_start()
-            elif system == "Linux":
-                if enabled:
-                    self._enable_linux_auto_start()
-                else:
-                    self._disable_linux_auto_start()
-            else:
-                warnings.warn(f"Auto-start not supported on {system}")
+            action()
+            self._enabled_cache = enabled
+            self._enabled_cache_time = time.monotonic()
         except Exception as e:
+            self.invalidate_cache()
             print(f"Error setting auto-start: {e}")
 
     def is_auto_start_enabled(self) -> bool:
-        """Check if auto-start is enabled on this system"""
-        system = platform.system()
+        """Check if auto-start is enabled on this system (cached for CACHE_TTL seconds)"""
+        now = time.monotonic()
+        if self._enabled_cache is not None and now - self._enabled_cache_time < self.CACHE_TTL:
+            return self._enabled_cache
+        self._enabled_cache = self._query_auto_start_enabled()
+        self._enabled_cache_time = now
+        return self._enabled_cache
+
+    def refresh(self) -> bool:
+        """Re-query the OS and update the cache; may block, so call off the UI thread"""
+        self.invalidate_cache()
+        return self.is_auto_start_enabled()
+
+    def peek_auto_start_enabled(self) -> Optional[bool]:
+        """Return the last known state without touching the OS (None if unknown)"""
+        return self._enabled_cache
+
+    def _query_auto_start_enabled(self) -> bool:
+        """Query the OS for the current auto-start state"""
+        if self._check is None:
+            return False
         try:
-            if system == "Windows":
-                import winreg
-                key = winreg.HKEY_CURRENT_USER
-                subkey = r"Software\Microsoft\Windows\CurrentVersion\Run"
-                try:
-                    with winreg.OpenKey(key, subkey, 0, winreg.KEY_READ) as reg_key:
-                        value, _ = winreg.QueryValueEx(reg_key, self.app_name)
-                        return isinstance(value, str) and len(value) > 0
-                except FileNotFoundError:
-                    return False
-            elif system == "Darwin":
-                plist_path = os.path.expanduser(f"~/Library/LaunchAgents/com.{self.app_name.lower()}.plist")
-                return os.path.exists(plist_path)
-            elif system == "Linux":
-                desktop_path = os.path.expanduser(f"~/.config/autostart/{self.app_name}.desktop")
-                return os.path.exists(desktop_path)
+            return self._check()
         except Exception:
             return False
-        return False
+
+    def _check_windows_auto_start(self) -> bool:
+        """Check the Run key on Windows"""
+        try:
+            with self._open_run_key() as reg_key:
+                value, _ = winreg.QueryValueEx(reg_key, self.app_name)
+                return bool(value)
+        except OSError:
+            # Missing key/value or access problems all mean "not enabled"
+            return False
+
+    def _check_macos_auto_start(self) -> bool:
+        """Check for the launch agent plist on macOS"""
+        return os.path.lexists(self._plist_path)
+
+    def _check_linux_auto_start(self) -> bool:
+        """Check for the autostart .desktop entry on Linux"""
+        return os.path.lexists(self._desktop_path)
+
+    @contextlib.contextmanager
+    def _open_run_key(self, access=None):
+        """Open the per-user Run key; read-only unless write access is asked for"""
+        if access is None:
+            access = winreg.KEY_READ
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.RUN_KEY, 0, access) as reg_key:
+            yield reg_key
+
+    def _get_windows_run_value(self, reg_key) -> Optional[str]:
+        """Return our command from an open Run key handle, or None if unset"""
+        try:
+            value, _ = winreg.QueryValueEx(reg_key, self.app_name)
+        except FileNotFoundError:
+            return None
+        return value if isinstance(value, str) else None
+
+    @staticmethod
+    def _write_if_changed(path, content) -> bool:
+        """Atomically write content to path; return False if it was already identical"""
+        try:
+            with open(path, 'r') as f:
+                if f.read() == content:
+                    return False
+        except OSError:
+            pass
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+        return True
 
     def _enable_windows_auto_start(self):
         """Enable auto-start on Windows"""
         try:
-            import winreg
-            
-            key = winreg.HKEY_CURRENT_USER
-            subkey = r"Software\Microsoft\Windows\CurrentVersion\Run"
+            if winreg is None:
+                raise ImportError("winreg not available")
             
-            with winreg.OpenKey(key, subkey, 0, winreg.KEY_SET_VALUE) as reg_key:
-                winreg.SetValueEx(reg_key, self.app_name, 0, winreg.REG_SZ, 
-                                f'"{sys.executable}" "{self.script_path}" --auto-mode --minimal')
+            # Read and write through one handle; skip the write if already set
+            with self._open_run_key(winreg.KEY_READ | winreg.KEY_SET_VALUE) as reg_key:
+                if self._get_windows_run_value(reg_key) != self._run_key_command:
+                    winreg.SetValueEx(reg_key, self.app_name, 0, winreg.REG_EXPAND_SZ,
+                                      self._run_key_command)
                 
         except ImportError:
             # Fallback method
-            startup_dir = os.path.join(os.getenv('APPDATA'), 
-                                     'Microsoft', 'Windows', 'Start Menu', 'Programs', 'Startup')
-            if os.path.exists(startup_dir):
-                bat_path = os.path.join(startup_dir, f"{self.app_name}.bat")
-                with open(bat_path, 'w') as f:
-                    f.write(f'"{sys.executable}" "{self.script_path}" --auto-mode --minimal\n')
+            if os.path.exists(os.path.dirname(self._bat_path)):
+                self._write_if_changed(self._bat_path, self._bat_content)
 
     def _disable_windows_auto_start(self):
         """Disable auto-start on Windows"""
         try:
-            import winreg
-            key = winreg.HKEY_CURRENT_USER
-            subkey = r"Software\Microsoft\Windows\CurrentVersion\Run"
-            with winreg.OpenKey(key, subkey, 0, winreg.KEY_SET_VALUE) as reg_key:
+            if winreg is None:
+                raise ImportError("winreg not available")
+            with self._open_run_key(winreg.KEY_READ | winreg.KEY_SET_VALUE) as reg_key:
                 try:
                     winreg.DeleteValue(reg_key, self.app_name)
                 except FileNotFoundError:
                     pass
         except Exception:
             # Best-effort: remove fallback bat if present
-            startup_dir = os.path.join(os.getenv('APPDATA'), 
-                                     'Microsoft', 'Windows', 'Start Menu', 'Programs', 'Startup')
-            bat_path = os.path.join(startup_dir, f"{self.app_name}.bat")
-            if os.path.exists(bat_path):
+            if os.path.exists(self._bat_path):
                 try:
-                    os.remove(bat_path)
+                    os.remove(self._bat_path)
                 except Exception:
                     pass
     
     def _enable_macos_auto_start(self):
         """Enable auto-start on macOS"""
-        plist_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>com.{self.app_name.lower()}</string>
-    <key>ProgramArguments</key>
-    <array>
-        <string>{sys.executable}</string>
-        <string>{self.script_path}</string>
-        <string>--auto-mode</string>
-        <string>--minimal</string>
-    </array>
-    <key>RunAtLoad</key>
-    <true/>
-    <key>KeepAlive</key>
-    <false/>
-</dict>
-</plist>'''
-        
-        plist_path = os.path.expanduser(f"~/Library/LaunchAgents/com.{self.app_name.lower()}.plist")
+        import subprocess
+        plist_path = self._plist_path
         os.makedirs(os.path.dirname(plist_path), exist_ok=True)
         
-        with open(plist_path, 'w') as f:
-            f.write(plist_content)
+        if not self._write_if_changed(plist_path, self._plist_content):
+            # Already installed with the same content; avoid launchctl churn
+            return
         
-        # Load the launch agent
-        subprocess.run(['launchctl', 'load', plist_path], capture_output=True)
+        # Load the launch agent; nothing waits on it, so don't block on launchctl
+        subprocess.Popen(['launchctl', 'load', plist_path],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=True)
     
     def _disable_macos_auto_start(self):
         """Disable auto-start on macOS"""
-        plist_path = os.path.expanduser(f"~/Library/LaunchAgents/com.{self.app_name.lower()}.plist")
+        import subprocess
+        plist_path = self._plist_path
         try:
-            subprocess.run(['launchctl', 'unload', plist_path], capture_output=True)
+            # Unload synchronously so it finishes before the plist is removed
+            subprocess.run(['launchctl', 'unload', plist_path],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
         except Exception:
             pass
         try:
@@ -151,27 +283,15 @@ class AutoStartManager:
     
     def _enable_linux_auto_start(self):
         """Enable auto-start on Linux"""
-        desktop_file = f'''[Desktop Entry]
-Type=Application
-Name={self.app_name}
-Exec={sys.executable} {self.script_path} --auto-mode --minimal
-Hidden=false
-NoDisplay=false
-X-GNOME-Autostart-enabled=true
-'''
-        
-        autostart_dir = os.path.expanduser("~/.config/autostart")
-        os.makedirs(autostart_dir, exist_ok=True)
-        
-        desktop_path = os.path.join(autostart_dir, f"{self.app_name}.desktop")
-        with open(desktop_path, 'w') as f:
-            f.write(desktop_file)
+        os.makedirs(self._autostart_dir, exist_ok=True)
         
-        os.chmod(desktop_path, 0o755)
+        desktop_path = self._desktop_path
+        if self._write_if_changed(desktop_path, self._desktop_content):
+            os.chmod(desktop_path, 0o755)
 
     def _disable_linux_auto_start(self):
         """Disable auto-start on Linux"""
-        desktop_path = os.path.expanduser(f"~/.config/autostart/{self.app_name}.desktop")
+        desktop_path = self._desktop_path
         try:
             if os.path.exists(desktop_path):
                 os.remove(desktop_path)
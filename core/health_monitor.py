@@ -2,17 +2,22 @@
 Core health monitoring functionality for Safe Warner
 """
 import cv2
+import math
 import time
 import numpy as np
 from datetime import datetime
 import json
 import os
+import queue
+import threading
 from utils.notifications import fast_notify
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import warnings
+from enum import IntEnum
 
 from utils.constants import *
 from utils.voice import voice
+from utils.ear_kernel import NUMBA_AVAILABLE, NUMBA_CACHE, njit, ear as ear_kernel
 
 # Handle optional MediaPipe dependency
 try:
@@ -21,21 +26,64 @@ try:
 except ImportError:
     MEDIAPIPE_AVAILABLE = False
     print("Warning: mediapipe not available. Some features will be disabled.")
-    # Create mock classes for MediaPipe
-    class MockMediaPipe:
-        class solutions:
-            class face_mesh:
-                class FaceMesh:
-                    def __init__(self, *args, **kwargs): pass
-                    def process(self, image): return type('obj', (object,), {'multi_face_landmarks': None})()
-            class pose:
-                class Pose:
-                    def __init__(self, *args, **kwargs): pass
-                    def process(self, image): return type('obj', (object,), {'pose_landmarks': None})()
-            drawing_utils = type('obj', (object,), {})()
-            drawing_styles = type('obj', (object,), {})()
-    
-    mp = MockMediaPipe()
+    mp = None
+
+# Handle optional orjson dependency (faster event-log serialization)
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _dumps = json.dumps
+
+@njit(cache=NUMBA_CACHE, nogil=True, fastmath=True)
+def _posture_numba(nose_xy, lear_xy, rear_xy, lsh_y, rsh_y, w, h):
+    """Head tilt angle (degrees) and slouch ratio from normalized pose landmarks"""
+    ear_center_x = (lear_xy[0] + rear_xy[0]) * 0.5 * w
+    ear_center_y = (lear_xy[1] + rear_xy[1]) * 0.5 * h
+    tilt_angle = math.degrees(math.atan2(nose_xy[0] * w - ear_center_x,
+                                         ear_center_y - nose_xy[1] * h))
+    slouch_ratio = (abs(lear_xy[1] - lsh_y) + abs(rear_xy[1] - rsh_y)) * 0.5
+    return tilt_angle, slouch_ratio
+
+# Alert types index the cooldown/stat arrays on HealthMonitor
+ALERT = IntEnum('ALERT', 'proximity posture blink_rate screen_time system_health '
+                         'eye_exercise', start=0)
+
+# Hershey fonts only cover ASCII, so overlay text uses plain markers instead of emoji
+OVERLAY_GAZE_TEXT = {'left': '<- Looking LEFT', 'right': '-> Looking RIGHT', 'center': 'Looking CENTER'}
+
+# Overlay border (color, thickness) indexed by (critical << 1) | screen-time warning
+BORDER_STYLES = (
+    (GREEN, 3),    # Green: all good
+    (CYAN, 4),     # Yellow: screen time warning
+    (RED, 5),      # Red: critical alert
+    (RED, 5),
+)
+
+# Per-phase prompts for the eye exercise; phases run right -> left
+EYE_EXERCISE_PHASES = {
+    'right': {
+        'next': 'left',
+        'label': 'RIGHT',
+        'arrow': '→',
+        'done_voice': "Good. Now look to the left for fifteen seconds.",
+        'done_title': "👀 Good! Now look LEFT",
+        'done_message': "Please look to the LEFT side for 15 seconds",
+        'pause_voice': "Please keep looking right to continue.",
+        'pause_title': "👀 Keep Looking Right",
+        'pause_message': "Please maintain your gaze to the RIGHT side to continue the exercise",
+    },
+    'left': {
+        'next': None,
+        'label': 'LEFT',
+        'arrow': '←',
+        'pause_voice': "Please keep looking left to continue.",
+        'pause_title': "👀 Keep Looking Left",
+        'pause_message': "Please maintain your gaze to the LEFT side to continue the exercise",
+    },
+}
 
 class HealthMonitor:
     def __init__(self, auto_mode=False):
@@ -44,23 +92,23 @@ class HealthMonitor:
             self.mp_face_mesh = mp.solutions.face_mesh
             self.mp_pose = mp.solutions.pose
             self.mp_drawing = mp.solutions.drawing_utils
-            self.mp_drawing_styles = mp.solutions.drawing_styles
             
-            # Models
-            self.face_mesh = self.mp_face_mesh.FaceMesh(
-                max_num_faces=1,
-                refine_landmarks=True,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
-            )
+            # Models are built on first use (see warmup), not here, so creating
+            # the monitor doesn't hold up the GUI's first paint
+            self.face_mesh = None
+            self.pose = None
             
-            self.pose = self.mp_pose.Pose(
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
-            )
+            # Face mesh and pose only share the input frame and release the GIL
+            # during inference, so run them side by side
+            self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mediapipe")
+            # Model build + warm-up job (see warmup); a solution must not run
+            # two calls at once, so the first real frame waits for it
+            self._warmup_future = None
         else:
             self.face_mesh = None
             self.pose = None
+            self._pool = None
+            self._warmup_future = None
             print("MediaPipe not available - camera features disabled")
         
         # Mode settings
@@ -70,6 +118,11 @@ class HealthMonitor:
         # Eye landmarks
         self.LEFT_EYE_LANDMARKS = LEFT_EYE_LANDMARKS
         self.RIGHT_EYE_LANDMARKS = RIGHT_EYE_LANDMARKS
+        # (2 eyes, 6 points) index array for a single vectorized gather
+        self._EYE_IDX = np.stack((LEFT_EYE_LANDMARKS_NP, RIGHT_EYE_LANDMARKS_NP))
+        self._LEFT_EYE_IDX = LEFT_EYE_LANDMARKS_NP
+        self._RIGHT_EYE_IDX = RIGHT_EYE_LANDMARKS_NP
+        self._GAZE_IDX = GAZE_LANDMARKS_NP
         
         # Pose landmarks
         self.NOSE_TIP = NOSE_TIP
@@ -90,20 +143,27 @@ class HealthMonitor:
         self.SCREEN_TIME_BREAK = SCREEN_TIME_BREAK
         self.NOTIFICATION_COOLDOWN = NOTIFICATION_COOLDOWN
         self.EYE_EXERCISE_DURATION = EYE_EXERCISE_DURATION
+        self.SYSTEM_CHECK_INTERVAL = SYSTEM_CHECK_INTERVAL
+        self.POSE_FRAME_STRIDE = POSE_FRAME_STRIDE
+        
+        # Inference input size (landmarks are normalized, so this is transparent)
+        self.ANALYSIS_SHORT_SIDE = ANALYSIS_SHORT_SIDE
         
         # Data tracking
-        self.blink_timestamps = deque(maxlen=100)
-        self.session_start = time.time()
-        self.last_break_time = time.time()
-        self.last_notification = {}
-        self.alert_stats = {
-            'proximity': 0,
-            'posture': 0,
-            'blink_rate': 0,
-            'screen_time': 0,
-            'system_health': 0,
-            'eye_exercise': 0
-        }
+        # Blink timestamps in a ring buffer; head/tail only ever advance, and
+        # tail skips past entries that have left the blink window
+        self._blink_ts = np.zeros(256, dtype=np.float64)
+        self._blink_head = 0
+        self._blink_tail = 0
+        self.session_start = time.monotonic()
+        self.last_break_time = time.monotonic()
+        # Per-alert cooldown timestamps and counters, indexed by ALERT
+        self._last_notif = np.full(len(ALERT), -np.inf, dtype=np.float64)
+        self._alert_counts = np.zeros(len(ALERT), dtype=np.int32)
+        self.alert_total = 0
+        # Cooldown for the exercise "keep looking" toast; not an alert type of its
+        # own (it is counted under ALERT.eye_exercise), so it stays out of ALERT
+        self._last_keep_prompt = -np.inf
         
         # Eye exercise state machine
         self.eye_exercise_active = False
@@ -115,11 +175,36 @@ class HealthMonitor:
         self.last_detection = "center"
         self.phase_start_time = 0
         self.paused_time_left = 15.0
+        self._log_last = {}
         
         # Auto-mode tracking
-        self.auto_mode_last_check = time.time()
+        self.auto_mode_last_check = time.monotonic()
         self.auto_mode_camera_active = False
         
+        # System health is polled on a deadline, not every frame
+        self._next_sys_check = 0.0
+        
+        # Posture changes slowly: pose runs on every POSE_FRAME_STRIDE-th frame
+        # and skipped frames reuse the last result
+        self._pose_counter = 0
+        self._last_posture = None
+        
+        # Reused per-frame inference buffers (reallocated only on size change)
+        self._small_buf = None
+        self._rgb_buf = None
+        # Normalized -> pixel scale for the current camera resolution
+        self._px_size = None
+        self._px_scale = None
+        
+        # Pre-rendered overlay text, keyed by (text, scale, color, thickness);
+        # dict order doubles as LRU order, bounded by TEXT_CACHE_SIZE
+        self._text_cache = {}
+        self._geom_cache = {}
+        self._last_ts_sec = 0
+        self._last_ts_str = ""
+        # Cleared by the GUI while its window is hidden
+        self.draw_enabled = True
+        
         # Session logging
         self.session_data = {
             'start_time': datetime.now().isoformat(),
@@ -128,6 +213,17 @@ class HealthMonitor:
             'mode': 'auto' if auto_mode else 'manual'
         }
         
+        # Events are appended to a per-session JSON-lines log by a background
+        # writer, so disk I/O stays off the frame path and survives a crash
+        self.session_log_file = (f"{SESSION_LOG_PREFIX}"
+                                 f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+        self._log_lock = threading.Lock()
+        # The log file is only created with the first event; until then there is none to point to
+        self._log_written = False
+        self._log_q = queue.Queue()
+        self._log_thread = threading.Thread(target=self._log_worker, name="session-log", daemon=True)
+        self._log_thread.start()
+        
         # Initialize psutil_available attribute
         self.psutil_available = False
         
@@ -145,7 +241,7 @@ class HealthMonitor:
         
         # Other existing initialization code...
         self.performance_warnings = []
-        self.last_check_time = time.time()
+        self.last_check_time = time.monotonic()
         self.check_interval = 30  # Check every 30 seconds
 
     def is_camera_available(self):
@@ -162,54 +258,37 @@ class HealthMonitor:
         if not self.auto_mode:
             return False
             
-        current_time = time.time()
+        current_time = time.monotonic()
         return current_time - self.auto_mode_last_check >= self.auto_mode_interval
 
-    def detect_gaze_direction(self, face_landmarks, image_width, image_height):
-        """Detect if user is looking left, right, or center"""
-        if not self.mediapipe_available:
-            return 'center'
+    def detect_gaze_direction(self, lm):
+        """Detect if user is looking left, right, or center from (N, 3) normalized landmarks"""
+        # Relative position of the eye centers to the nose, in eye widths.
+        # A degenerate (zero-width) eye divides by zero, giving +-inf (or nan);
+        # anything non-finite is treated as 'center'.
+        x = lm[self._GAZE_IDX, 0]
+        corners = x[:4].reshape(2, 2)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            relative = (corners.mean(axis=1) - x[4]) / np.abs(corners[:, 1] - corners[:, 0])
+        gaze_direction = relative.mean()
         
-        try:
-            # Use relative position of iris landmarks to detect gaze
-            left_eye_inner = face_landmarks[133]
-            left_eye_outer = face_landmarks[33]
-            right_eye_inner = face_landmarks[362]
-            right_eye_outer = face_landmarks[263]
-            
-            left_eye_center_x = (left_eye_inner.x + left_eye_outer.x) / 2
-            right_eye_center_x = (right_eye_inner.x + right_eye_outer.x) / 2
-            
-            left_eye_width = abs(left_eye_outer.x - left_eye_inner.x)
-            right_eye_width = abs(right_eye_outer.x - right_eye_inner.x)
-            
-            nose_tip = face_landmarks[1]
-            
-            left_eye_relative = (left_eye_center_x - nose_tip.x) / left_eye_width
-            right_eye_relative = (right_eye_center_x - nose_tip.x) / right_eye_width
-            
-            gaze_direction = (left_eye_relative + right_eye_relative) / 2
-            
-            if gaze_direction > self.GAZE_THRESHOLD:
-                return 'right'
-            elif gaze_direction < -self.GAZE_THRESHOLD:
-                return 'left'
-            else:
-                return 'center'
-                
-        except Exception as e:
-            print(f"Gaze detection error: {e}")
+        if not np.isfinite(gaze_direction):
             return 'center'
+        if gaze_direction > self.GAZE_THRESHOLD:
+            return 'right'
+        elif gaze_direction < -self.GAZE_THRESHOLD:
+            return 'left'
+        return 'center'
 
     def start_eye_exercise(self):
         """Start the 15-second eye exercise routine"""
         self.eye_exercise_active = True
-        self.eye_exercise_start_time = time.time()
+        self.eye_exercise_start_time = time.monotonic()
         self.time_left = 15.0
         self.exercise_done = False
         self.current_phase = "right"
         self.countdown_active = False
-        self.phase_start_time = time.time()
+        self.phase_start_time = time.monotonic()
         self.paused_time_left = 15.0
         
         print("=== EYE EXERCISE STARTED ===")
@@ -221,128 +300,97 @@ class HealthMonitor:
         self.send_notification(
             "👀 Eye Exercise Time!",
             "Please look to the RIGHT side for 15 seconds",
-            'eye_exercise'
+            ALERT.eye_exercise
         )
 
+    def _log_throttled(self, key, msg, period=1.0):
+        """Print msg at most once per period seconds for a given key"""
+        now = time.monotonic()
+        if now - self._log_last.get(key, -math.inf) >= period:
+            self._log_last[key] = now
+            print(msg)
+
     def update_eye_exercise(self, detection):
         """Update the eye exercise state based on current gaze direction"""
         if not self.eye_exercise_active or self.exercise_done:
             return
             
-        current_time = time.time()
-        
-        # Step 1: Watch Right
-        if self.current_phase == "right":
-            if detection == "right":
-                if not self.countdown_active:
-                    # Start countdown for right phase
-                    self.countdown_active = True
-                    self.phase_start_time = current_time
-                    self.time_left = self.paused_time_left
-                    print("✓ Correct! Looking right detected. Starting countdown...")
-                
-                # Update countdown
-                elapsed = current_time - self.phase_start_time
-                self.time_left = max(0, self.paused_time_left - elapsed)
-                
-                # Check if right phase is complete
-                if self.time_left <= 0:
-                    print("=== RIGHT SIDE COMPLETE ===")
-                    print("Now please look to the LEFT side")
+        current_time = time.monotonic()
+        phase = self.current_phase
+        cfg = EYE_EXERCISE_PHASES[phase]
+        
+        if detection == phase:
+            if not self.countdown_active:
+                # Start countdown for this phase
+                self.countdown_active = True
+                self.phase_start_time = current_time
+                self.time_left = self.paused_time_left
+                self._log_throttled('exercise_start',
+                                    f"✓ Correct! Looking {phase} detected. Starting countdown...")
+            
+            # Update countdown
+            elapsed = current_time - self.phase_start_time
+            self.time_left = max(0, self.paused_time_left - elapsed)
+            
+            # Check if this phase is complete
+            if self.time_left <= 0:
+                if cfg['next'] is None:
+                    self._complete_eye_exercise(current_time)
+                else:
+                    print(f"=== {cfg['label']} SIDE COMPLETE ===")
+                    print(f"Now please look to the {cfg['next'].upper()} side")
                     # Voice guidance
-                    voice.speak("Good. Now look to the left for fifteen seconds.")
-                    self.current_phase = "left"
+                    voice.speak(cfg['done_voice'])
+                    self.current_phase = cfg['next']
                     self.countdown_active = False
                     self.paused_time_left = 15.0
                     self.time_left = 15.0
                     
-                    self.send_notification(
-                        "👀 Good! Now look LEFT",
-                        "Please look to the LEFT side for 15 seconds",
-                        'eye_exercise'
-                    )
-            else:
-                # User is not looking right
-                if self.countdown_active:
-                    # Pause the countdown
-                    self.countdown_active = False
-                    self.paused_time_left = self.time_left
-                    print("⚠️  Please maintain looking RIGHT. Timer paused.")
-                    # Voice guidance
-                    voice.speak("Please keep looking right to continue.")
-                    self.send_notification(
-                        "👀 Keep Looking Right",
-                        "Please maintain your gaze to the RIGHT side to continue the exercise",
-                        'eye_exercise'
-                    )
-                else:
-                    # Still waiting for user to look right
-                    if self.paused_time_left < 15.0:
-                        print(f"→ Timer paused at {self.paused_time_left:.1f}s. Look RIGHT to resume.")
-                    else:
-                        print("→ Waiting for you to look RIGHT...")
-        
-        # Step 2: Watch Left
-        elif self.current_phase == "left":
-            if detection == "left":
-                if not self.countdown_active:
-                    # Start countdown for left phase
-                    self.countdown_active = True
-                    self.phase_start_time = current_time
-                    self.time_left = self.paused_time_left
-                    print("✓ Correct! Looking left detected. Starting countdown...")
-                
-                # Update countdown
-                elapsed = current_time - self.phase_start_time
-                self.time_left = max(0, self.paused_time_left - elapsed)
-                
-                # Check if left phase is complete
-                if self.time_left <= 0:
-                    # Exercise complete
-                    self.eye_exercise_active = False
-                    self.exercise_done = True
-                    total_duration = current_time - self.eye_exercise_start_time
-                    
-                    print(f"=== EYE EXERCISE COMPLETED in {total_duration:.1f} seconds ===")
-                    # Voice guidance
-                    voice.speak("Exercise complete. Great job.")
-                    
-                    self.send_notification(
-                        "✅ Exercise Complete!",
-                        "Great job! Your eye exercise is complete.",
-                        'eye_exercise'
-                    )
-                    
-                    # Log the exercise
-                    self.session_data['eye_exercises'].append({
-                        'timestamp': datetime.now().isoformat(),
-                        'duration': total_duration,
-                        'success': True
-                    })
-                    
-                    # Reset auto-mode timer after exercise completion
-                    if self.auto_mode:
-                        self.auto_mode_last_check = time.time()
-            else:
-                # User is not looking left
-                if self.countdown_active:
-                    # Pause the countdown
-                    self.countdown_active = False
-                    self.paused_time_left = self.time_left
-                    print("⚠️  Please maintain looking LEFT. Timer paused.")
-                    # Voice guidance
-                    voice.speak("Please keep looking left to continue.")
-                    self.send_notification(
-                        "👀 Keep Looking Left",
-                        "Please maintain your gaze to the LEFT side to continue the exercise",
-                        'eye_exercise'
-                    )
-                else:
-                    # Still waiting for user to look left
-                    if self.paused_time_left < 15.0:
-                        print(f"← Timer paused at {self.paused_time_left:.1f}s. Look LEFT to resume.")
-                    else:
-                        print("← Waiting for you to look LEFT...")
+                    self.send_notification(cfg['done_title'], cfg['done_message'], ALERT.eye_exercise)
+        elif self.countdown_active:
+            # User looked away: pause the countdown
+            self.countdown_active = False
+            self.paused_time_left = self.time_left
+            self._log_throttled('exercise_pause', f"⚠️  Please maintain looking {cfg['label']}. Timer paused.")
+            # Voice guidance
+            voice.speak(cfg['pause_voice'])
+            # Looking away repeatedly shouldn't fire a toast every time
+            if current_time - self._last_keep_prompt >= self.NOTIFICATION_COOLDOWN:
+                self._last_keep_prompt = current_time
+                self.send_notification(cfg['pause_title'], cfg['pause_message'], ALERT.eye_exercise)
+        elif self.paused_time_left < 15.0:
+            # Still waiting for the user (runs every frame)
+            self._log_throttled('exercise_wait', f"{cfg['arrow']} Timer paused at {self.paused_time_left:.1f}s. "
+                                                 f"Look {cfg['label']} to resume.")
+        else:
+            self._log_throttled('exercise_wait', f"{cfg['arrow']} Waiting for you to look {cfg['label']}...")
+
+    def _complete_eye_exercise(self, current_time):
+        """Finish the exercise after the last phase"""
+        self.eye_exercise_active = False
+        self.exercise_done = True
+        total_duration = current_time - self.eye_exercise_start_time
+        
+        print(f"=== EYE EXERCISE COMPLETED in {total_duration:.1f} seconds ===")
+        # Voice guidance
+        voice.speak("Exercise complete. Great job.")
+        
+        self.send_notification(
+            "✅ Exercise Complete!",
+            "Great job! Your eye exercise is complete.",
+            ALERT.eye_exercise
+        )
+        
+        # Log the exercise (appended to session_data by _log_worker)
+        self._log_q.put_nowait(('eye_exercises', {
+            'timestamp': time.time(),
+            'duration': total_duration,
+            'success': True
+        }))
+        
+        # Reset auto-mode timer after exercise completion
+        if self.auto_mode:
+            self.auto_mode_last_check = time.monotonic()
 
     def get_eye_exercise_status(self):
         """Get current status of eye exercise for display"""
@@ -352,64 +400,100 @@ class HealthMonitor:
         status = {
             'phase': self.current_phase,
             'remaining_time': self.time_left,
-            'total_elapsed': time.time() - self.eye_exercise_start_time,
+            'total_elapsed': time.monotonic() - self.eye_exercise_start_time,
             'paused': not self.countdown_active,
             'exercise_done': self.exercise_done
         }
         
         return status
 
-    def eye_aspect_ratio(self, landmarks, image_width, image_height):
-        """Calculate Eye Aspect Ratio for blink detection"""
-        def calculate_ear(eye_landmarks):
-            points = []
-            for idx in eye_landmarks:
-                landmark = landmarks[idx]
-                x = landmark.x * image_width
-                y = landmark.y * image_height
-                points.append((x, y))
-            
-            vertical1 = np.linalg.norm(np.array(points[1]) - np.array(points[5]))
-            vertical2 = np.linalg.norm(np.array(points[2]) - np.array(points[4]))
-            horizontal = np.linalg.norm(np.array(points[0]) - np.array(points[3]))
-            
-            return (vertical1 + vertical2) / (2.0 * horizontal) if horizontal != 0 else 0.0
+    def _warmup_kernels(self):
+        """Compile the numba kernels now, with the argument types process_frame uses"""
+        dummy = np.zeros((468, 2), dtype=np.float32)
+        ear_kernel(dummy, self._LEFT_EYE_IDX)
+        _posture_numba((0.5, 0.4), (0.45, 0.4), (0.55, 0.4), 0.6, 0.6, 640.0, 480.0)
+
+    def warmup(self):
+        """Build the MediaPipe solutions and run one throwaway inference each in the
+        background, so the first camera frame doesn't pay for it; returns the job's future"""
+        if not self.mediapipe_available:
+            return None
+        if self._warmup_future is None:
+            self._warmup_future = self._pool.submit(self._build_models)
+        return self._warmup_future
+
+    def _build_models(self):
+        """Create the face mesh and pose solutions (runs on a pool worker)"""
+        # The numba kernels are only needed once frames are analyzed; without the
+        # on-disk cache (frozen builds) this is a full compile, so keep it off the GUI thread
+        if NUMBA_AVAILABLE:
+            self._warmup_kernels()
         
-        left_ear = calculate_ear(self.LEFT_EYE_LANDMARKS)
-        right_ear = calculate_ear(self.RIGHT_EYE_LANDMARKS)
+        # Video mode (tracking between frames); gaze uses eye-corner landmarks,
+        # so the extra iris-refinement model (refine_landmarks) isn't needed
+        face_mesh = self.mp_face_mesh.FaceMesh(
+            static_image_mode=False,
+            max_num_faces=1,
+            refine_landmarks=False,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
         
-        return (left_ear + right_ear) / 2.0
+        # Full pose model (complexity 1) on purpose: it ships in the mediapipe
+        # wheel, whereas the lite model is downloaded on first use, which fails
+        # offline or from a read-only install of the frozen build
+        pose = self.mp_pose.Pose(
+            model_complexity=1,
+            smooth_landmarks=True,
+            enable_segmentation=False,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+        
+        # Blank frame at the analysis size of a 4:3 camera: builds the
+        # interpreters and XNNPACK kernels ahead of the first real frame
+        dummy = np.zeros((self.ANALYSIS_SHORT_SIDE, self.ANALYSIS_SHORT_SIDE * 4 // 3, 3), dtype=np.uint8)
+        face_mesh.process(dummy)
+        pose.process(dummy)
+        # Published only once warm, so process_frame can't overlap the warm-up calls
+        self.face_mesh = face_mesh
+        self.pose = pose
+
+    def eye_aspect_ratio(self, lm_xy):
+        """Calculate Eye Aspect Ratio for blink detection from (N, 2) pixel landmarks"""
+        if NUMBA_AVAILABLE:
+            return (ear_kernel(lm_xy, self._LEFT_EYE_IDX) +
+                    ear_kernel(lm_xy, self._RIGHT_EYE_IDX)) / 2.0
+        
+        eyes = lm_xy[self._EYE_IDX]  # (2, 6, 2)
+        vertical1 = np.hypot(*(eyes[:, 1] - eyes[:, 5]).T)
+        vertical2 = np.hypot(*(eyes[:, 2] - eyes[:, 4]).T)
+        horizontal = np.hypot(*(eyes[:, 0] - eyes[:, 3]).T)
+        
+        ear = np.divide(vertical1 + vertical2, 2.0 * horizontal,
+                        out=np.zeros_like(horizontal), where=horizontal != 0)
+        return float(ear.mean())
 
     def analyze_posture(self, pose_landmarks, image_width, image_height):
         """Analyze posture based on pose landmarks"""
-        if not pose_landmarks or not self.mediapipe_available:
+        if not pose_landmarks:
             return None
         
         landmarks = pose_landmarks.landmark
         
         try:
-            # Calculate head tilt
             nose = landmarks[self.NOSE_TIP]
             left_ear = landmarks[self.LEFT_EAR]
             right_ear = landmarks[self.RIGHT_EAR]
-            
-            # Convert to pixel coordinates
-            nose_x, nose_y = nose.x * image_width, nose.y * image_height
-            left_ear_x, left_ear_y = left_ear.x * image_width, left_ear.y * image_height
-            right_ear_x, right_ear_y = right_ear.x * image_width, right_ear.y * image_height
-            
-            # Calculate head tilt angle
-            ear_center_x = (left_ear_x + right_ear_x) / 2
-            ear_center_y = (left_ear_y + right_ear_y) / 2
-            tilt_angle = np.degrees(np.arctan2(nose_x - ear_center_x, ear_center_y - nose_y))
-            
-            # Calculate slouching (shoulder-to-ear distance ratio)
             left_shoulder = landmarks[self.LEFT_SHOULDER]
             right_shoulder = landmarks[self.RIGHT_SHOULDER]
             
-            left_ear_shoulder_dist = abs(left_ear.y - left_shoulder.y)
-            right_ear_shoulder_dist = abs(right_ear.y - right_shoulder.y)
-            slouch_ratio = (left_ear_shoulder_dist + right_ear_shoulder_dist) / 2
+            # Head tilt angle (pixel space) and slouching (ear-to-shoulder distance)
+            tilt_angle, slouch_ratio = _posture_numba(
+                (nose.x, nose.y), (left_ear.x, left_ear.y), (right_ear.x, right_ear.y),
+                left_shoulder.y, right_shoulder.y,
+                float(image_width), float(image_height)
+            )
             
             return {
                 'tilt_angle': tilt_angle,
@@ -454,51 +538,104 @@ class HealthMonitor:
             
         return system_info
 
+    @property
+    def alert_stats(self):
+        """Alert counts by type name"""
+        return {alert.name: int(self._alert_counts[alert]) for alert in ALERT}
+
     def should_notify(self, alert_type):
         """Check if we should send notification (cooldown)"""
-        current_time = time.time()
-        last_time = self.last_notification.get(alert_type, 0)
-        return current_time - last_time >= self.NOTIFICATION_COOLDOWN
+        return time.monotonic() - self._last_notif[alert_type] >= self.NOTIFICATION_COOLDOWN
 
     def send_notification(self, title, message, alert_type):
         """Send desktop notification"""
-        if not self.should_notify(alert_type) and alert_type != 'eye_exercise':
+        if alert_type != ALERT.eye_exercise and not self.should_notify(alert_type):
             return
             
         try:
             delivered = fast_notify(title, message, duration=5, app_id="Safe Warner")
-            self.last_notification[alert_type] = time.time()
-            self.alert_stats[alert_type] += 1
+            self._last_notif[alert_type] = time.monotonic()
+            self._alert_counts[alert_type] += 1
+            self.alert_total += 1
             
-            # Log the alert
-            self.session_data['alerts'].append({
-                'timestamp': datetime.now().isoformat(),
-                'type': alert_type,
+            # Log the alert (written out by _log_worker)
+            self._log_q.put_nowait(('alerts', {
+                'timestamp': time.time(),
+                'type': alert_type.name,
                 'title': title,
                 'message': message
-            })
-            print(f"Alert: {title} - {message}")
+            }))
             
         except Exception as e:
             print(f"Notification error: {e}")
 
-    def check_proximity(self, face_landmarks, image_height):
-        """Check if face is too close to screen"""
+    def _log_worker(self):
+        """Drain queued records into session_data and the JSON-lines session log"""
+        log_file = None
+        while True:
+            batch = [self._log_q.get()]
+            try:
+                while True:
+                    batch.append(self._log_q.get_nowait())
+            except queue.Empty:
+                pass
+            
+            # Records carry a wall-clock float; format it here rather than on the caller's thread
+            for _, entry in batch:
+                entry['timestamp'] = datetime.fromtimestamp(entry['timestamp']).isoformat()
+            
+            with self._log_lock:
+                for section, entry in batch:
+                    self.session_data[section].append(entry)
+            
+            try:
+                if log_file is None:
+                    log_file = open(self.session_log_file, 'a', encoding='utf-8')
+                log_file.write(''.join(_dumps({'event': section, **entry}) + '\n'
+                                       for section, entry in batch))
+                log_file.flush()
+                self._log_written = True
+            except Exception as e:
+                print(f"Session log error: {e}")
+            
+            for section, entry in batch:
+                if section == 'alerts':
+                    print(f"Alert: {entry['title']} - {entry['message']}")
+                self._log_q.task_done()
+
+    def flush_session_log(self):
+        """Wait for queued events to reach the session log; returns its filename, or None if no event was written yet"""
+        self._log_q.join()
+        return self.session_log_file if self._log_written else None
+
+    def check_proximity(self, lm_y):
+        """Check if face is too close to screen from normalized landmark y values"""
         try:
-            ys = [lm.y for lm in face_landmarks]
-            bbox_height = max(ys) - min(ys)
-            return bbox_height > self.PROXIMITY_THRESHOLD
+            return float(np.ptp(lm_y)) > self.PROXIMITY_THRESHOLD
         except Exception as e:
             print(f"Proximity check error: {e}")
             return False
 
+    def record_blink(self, timestamp):
+        """Append a blink timestamp to the ring buffer"""
+        size = len(self._blink_ts)
+        self._blink_ts[self._blink_head % size] = timestamp
+        self._blink_head += 1
+        if self._blink_head - self._blink_tail > size:
+            # Buffer full: drop the oldest entry
+            self._blink_tail = self._blink_head - size
+
     def check_blink_rate(self):
         """Check if blink rate is too low"""
         try:
-            current_time = time.time()
+            current_time = time.monotonic()
             window_start = current_time - self.BLINK_WINDOW
             
-            recent_blinks = sum(1 for t in self.blink_timestamps if t >= window_start)
+            size = len(self._blink_ts)
+            while (self._blink_tail < self._blink_head and
+                   self._blink_ts[self._blink_tail % size] < window_start):
+                self._blink_tail += 1
+            recent_blinks = self._blink_head - self._blink_tail
             expected_min_blinks = (self.BLINK_WINDOW / 60) * 8
             
             return recent_blinks < expected_min_blinks
@@ -508,64 +645,108 @@ class HealthMonitor:
 
     def check_screen_time(self):
         """Check if screen time break is needed"""
-        current_time = time.time()
+        current_time = time.monotonic()
         return current_time - self.last_break_time > self.SCREEN_TIME_BREAK
 
-    def process_frame(self, frame):
+    def process_frame(self, frame, out=None):
         """Process a single frame and check all health metrics"""
-        results = {}
         h, w = frame.shape[:2]
+        # Callers may pass one dict to reuse across frames; it's cleared here
+        results = {} if out is None else out
+        results.clear()
         
-        # Check if MediaPipe is available
+        # Without MediaPipe there are no models to run; bail out before any image work
         if not self.mediapipe_available:
             results['error'] = 'MediaPipe not available'
             return results
             
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # The resolution is fixed for a session; rebuild the scale only if it changes
+        if self._px_size != (w, h):
+            self._px_size = (w, h)
+            self._px_scale = np.array([w, h], dtype=np.float32)
+        
+        # The models resize to their own small input tensors anyway, so feed them
+        # a reduced frame; pixel-space math below still uses the original (w, h)
+        analysis_frame = frame
+        scale = self.ANALYSIS_SHORT_SIDE / min(h, w)
+        if scale < 1.0:
+            size = (round(w * scale), round(h * scale))
+            if self._small_buf is None or self._small_buf.shape[1::-1] != size:
+                self._small_buf = np.empty((size[1], size[0], 3), dtype=frame.dtype)
+            cv2.resize(frame, size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+            analysis_frame = self._small_buf
+        if self._rgb_buf is None or self._rgb_buf.shape != analysis_frame.shape:
+            self._rgb_buf = np.empty_like(analysis_frame)
+        cv2.cvtColor(analysis_frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        rgb_frame = self._rgb_buf
+        
+        # Models are published by the warm-up job; block on it until then
+        if self.face_mesh is None or self.pose is None:
+            try:
+                self.warmup().result()
+            except Exception as e:
+                self._log_throttled('model_load', f"MediaPipe model load error: {e}", period=10.0)
+                results['error'] = str(e)
+                return results
+        
+        # Each solution is only ever used by one pool worker at a time
+        face_future = self._pool.submit(self.face_mesh.process, rgb_frame)
+        # During an eye exercise only gaze drives the state machine, so pose,
+        # proximity, blink and system checks are all skipped
+        exercising = self.eye_exercise_active
+        self._pose_counter = (self._pose_counter + 1) % self.POSE_FRAME_STRIDE
+        run_pose = not exercising and (self._pose_counter == 0 or self.auto_mode)
+        pose_future = self._pool.submit(self.pose.process, rgb_frame) if run_pose else None
         
         # Auto-mode logic
         if self.auto_mode and self.should_check_auto_mode():
             print("Auto-mode: Performing periodic health check...")
-            self.auto_mode_last_check = time.time()
+            self.auto_mode_last_check = time.monotonic()
         
         # Face detection and analysis
         try:
-            face_results = self.face_mesh.process(rgb_frame)
+            face_results = face_future.result()
             if face_results.multi_face_landmarks:
                 face_landmarks = face_results.multi_face_landmarks[0]
+                # Walk the protobuf landmarks once per frame; every check below
+                # works on these arrays instead of per-attribute lookups
+                lm = np.array([(p.x, p.y, p.z) for p in face_landmarks.landmark],
+                              dtype=np.float32)
+                lm_xy = lm[:, :2] * self._px_scale
                 
                 # Gaze detection
-                gaze_direction = self.detect_gaze_direction(face_landmarks.landmark, w, h)
+                gaze_direction = self.detect_gaze_direction(lm)
                 results['gaze_direction'] = gaze_direction
                 self.last_detection = gaze_direction
                 
                 # Update eye exercise if active
-                if self.eye_exercise_active:
+                if exercising:
                     self.update_eye_exercise(gaze_direction)
+                    return results
                 
                 # Proximity check
-                results['proximity_alert'] = self.check_proximity(face_landmarks.landmark, h)
-                if results['proximity_alert'] and self.should_notify('proximity') and not self.eye_exercise_active:
+                results['proximity_alert'] = self.check_proximity(lm[:, 1])
+                if results['proximity_alert'] and self.should_notify(ALERT.proximity) and not self.eye_exercise_active:
                     self.send_notification(
                         "📱 Move Back Slightly",
                         "You're sitting too close to the screen. Maintain 20-30cm distance.",
-                        'proximity'
+                        ALERT.proximity
                     )
                 
                 # Blink detection
-                ear = self.eye_aspect_ratio(face_landmarks.landmark, w, h)
+                ear = self.eye_aspect_ratio(lm_xy)
                 results['ear'] = ear
                 
                 if ear < self.EAR_THRESHOLD:
-                    self.blink_timestamps.append(time.time())
+                    self.record_blink(time.monotonic())
                 
                 # Blink rate check
                 results['low_blink_rate'] = self.check_blink_rate()
-                if results['low_blink_rate'] and self.should_notify('blink_rate') and not self.eye_exercise_active:
+                if results['low_blink_rate'] and self.should_notify(ALERT.blink_rate) and not self.eye_exercise_active:
                     self.send_notification(
                         "👁️ Rest Your Eyes",
                         "Your blink rate is low. Remember to blink regularly.",
-                        'blink_rate'
+                        ALERT.blink_rate
                     )
                     
                 # Auto-mode: Trigger exercise if issues detected (only after interval)
@@ -574,32 +755,42 @@ class HealthMonitor:
                         self.check_screen_time()):
                         print("Auto-mode: Health issues detected, starting exercise...")
                         self.start_eye_exercise()
-                        self.last_break_time = time.time()
+                        self.last_break_time = time.monotonic()
                         
         except Exception as e:
             print(f"Face processing error: {e}")
             results['face_error'] = str(e)
         
+        if exercising:
+            return results
+        
         # Pose detection and posture analysis
         try:
-            pose_results = self.pose.process(rgb_frame)
-            if pose_results.pose_landmarks:
+            pose_results = pose_future.result() if pose_future is not None else None
+            if pose_results is None:
+                # Skipped frame: keep showing the last posture
+                if self._last_posture is not None:
+                    results['posture'] = self._last_posture
+            elif not pose_results.pose_landmarks:
+                self._last_posture = None
+            else:
                 posture_data = self.analyze_posture(pose_results.pose_landmarks, w, h)
                 results['posture'] = posture_data
+                self._last_posture = posture_data
                 
                 if posture_data and not self.eye_exercise_active:
-                    if posture_data['is_tilted'] and self.should_notify('posture'):
+                    if posture_data['is_tilted'] and self.should_notify(ALERT.posture):
                         self.send_notification(
                             "🎯 Adjust Your Posture",
                             "Your head is tilted. Keep your head straight and aligned.",
-                            'posture'
+                            ALERT.posture
                         )
                     
-                    if posture_data['is_slouching'] and self.should_notify('posture'):
+                    if posture_data['is_slouching'] and self.should_notify(ALERT.posture):
                         self.send_notification(
                             "💪 Sit Up Straight",
                             "You're slouching. Straighten your back and relax your shoulders.",
-                            'posture'
+                            ALERT.posture
                         )
                     
                     # Auto-mode: Trigger exercise for posture issues (only after interval)
@@ -607,7 +798,7 @@ class HealthMonitor:
                         if (posture_data['is_tilted'] or posture_data['is_slouching']):
                             print("Auto-mode: Posture issues detected, starting exercise...")
                             self.start_eye_exercise()
-                            self.last_break_time = time.time()
+                            self.last_break_time = time.monotonic()
                             
         except Exception as e:
             print(f"Pose processing error: {e}")
@@ -615,58 +806,115 @@ class HealthMonitor:
         
         # Screen time check - trigger eye exercise
         results['screen_time_alert'] = self.check_screen_time()
-        if results['screen_time_alert'] and self.should_notify('screen_time') and not self.eye_exercise_active:
+        if results['screen_time_alert'] and self.should_notify(ALERT.screen_time) and not self.eye_exercise_active:
             if not self.auto_mode:  # In manual mode, notify user
                 self.send_notification(
                     "⏰ Time for a Break!",
                     "You've been using the screen for 20 minutes. Consider taking a break.",
-                    'screen_time'
+                    ALERT.screen_time
                 )
             
-        # System health check (run less frequently)
-        if int(time.time()) % 10 == 0 and not self.eye_exercise_active:
+        # System health check (battery/sensor reads are expensive; at most once per interval)
+        now = time.monotonic()
+        if now >= self._next_sys_check and not self.eye_exercise_active:
+            self._next_sys_check = now + self.SYSTEM_CHECK_INTERVAL
             system_info = self.check_system_health()
             results['system_info'] = system_info
             
             if system_info.get('available'):
                 for key, temp in system_info.items():
                     if 'temp' in key and temp > 70:
-                        if self.should_notify('system_health'):
+                        if self.should_notify(ALERT.system_health):
                             self.send_notification(
                                 "🔥 System Running Hot",
                                 f"High temperature detected ({temp}°C). Consider taking a break.",
-                                'system_health'
+                                ALERT.system_health
                             )
         
         return results
 
+    def _text_sprite(self, text, scale, color, thickness):
+        """Render text once into a (sprite, mask, origin) tuple for blitting"""
+        key = (text, scale, color, thickness)
+        cached = self._text_cache.pop(key, None)
+        if cached is None:
+            (tw, th), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)
+            pad = thickness + 1
+            mask = np.zeros((th + baseline + 2 * pad, tw + 2 * pad), dtype=np.uint8)
+            origin = (pad, pad + th)
+            cv2.putText(mask, text, origin, cv2.FONT_HERSHEY_SIMPLEX, scale, 255, thickness)
+            sprite = np.empty(mask.shape + (3,), dtype=np.uint8)
+            sprite[:] = color
+            cached = (sprite, mask[:, :, None].astype(bool), origin)
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+        # (Re)insert as most recently used
+        self._text_cache[key] = cached
+        return cached
+
+    def _blit_text(self, frame, text, org, scale, color, thickness):
+        """Drop-in for cv2.putText on static strings, using a cached sprite"""
+        sprite, mask, (ox, oy) = self._text_sprite(text, scale, color, thickness)
+        x0, y0 = org[0] - ox, org[1] - oy
+        sh, sw = mask.shape[:2]
+        fh, fw = frame.shape[:2]
+        # Clip the sprite against the frame edges
+        cx0, cy0 = max(0, -x0), max(0, -y0)
+        cx1, cy1 = min(sw, fw - x0), min(sh, fh - y0)
+        if cx0 >= cx1 or cy0 >= cy1:
+            return
+        roi = frame[y0 + cy0:y0 + cy1, x0 + cx0:x0 + cx1]
+        np.copyto(roi, sprite[cy0:cy1, cx0:cx1], where=mask[cy0:cy1, cx0:cx1])
+
+    def _arrow_geometry(self, w, h):
+        """Exercise arrow endpoints and label origin for a frame size (cached)"""
+        geom = self._geom_cache.get((w, h))
+        if geom is None:
+            arrow_x, mid_y = w // 2, h // 2
+            geom = self._geom_cache[(w, h)] = {
+                'west': (arrow_x - 100, mid_y),
+                'east': (arrow_x + 100, mid_y),
+                'label': (arrow_x - 150, mid_y - 20),
+            }
+        return geom
+
     def draw_overlay(self, frame, results):
         """Draw analysis results on the frame"""
+        if not self.draw_enabled:
+            return frame
+        
         h, w = frame.shape[:2]
         
+        # Read the alert flags once; they drive the status lines and the border
+        posture = results.get('posture') or {}
+        prox = bool(results.get('proximity_alert'))
+        low_blink = bool(results.get('low_blink_rate'))
+        scr = bool(results.get('screen_time_alert'))
+        tilt = bool(posture.get('is_tilted'))
+        slouch = bool(posture.get('is_slouching'))
+        critical = prox or low_blink or tilt or slouch
+        
         try:
             # Mode indicator
             mode_text = "AUTO MODE" if self.auto_mode else "MANUAL MODE"
-            mode_color = (0, 255, 255) if self.auto_mode else (255, 255, 0)
-            cv2.putText(frame, mode_text, (w - 150, h - 20), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, mode_color, 2)
+            mode_color = YELLOW if self.auto_mode else CYAN
+            self._blit_text(frame, mode_text, (w - 150, h - 20), 0.6, mode_color, 2)
             
             # Auto-mode status
             if self.auto_mode and not self.eye_exercise_active:
-                next_check = max(0, self.auto_mode_interval - (time.time() - self.auto_mode_last_check))
+                next_check = max(0, self.auto_mode_interval - (time.monotonic() - self.auto_mode_last_check))
                 check_min, check_sec = divmod(int(next_check), 60)
                 auto_text = f"Next check: {check_min:02d}:{check_sec:02d}"
-                cv2.putText(frame, auto_text, (10, h - 20), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
+                self._blit_text(frame, auto_text, (10, h - 20), 0.5, (200, 200, 200), 1)
             
             # Eye exercise overlay (priority display)
             if self.eye_exercise_active:
                 exercise_status = self.get_eye_exercise_status()
                 if exercise_status:
-                    # Semi-transparent background for exercise info
-                    overlay = frame.copy()
-                    cv2.rectangle(overlay, (0, 0), (w, 150), (0, 0, 0), -1)
-                    cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+                    # Semi-transparent background for exercise info: a 70% black
+                    # blend is just a 0.3 scale, done in place on the band
+                    band = frame[:150]
+                    cv2.convertScaleAbs(band, band, alpha=0.3)
                     
                     phase_text = f"Look {exercise_status['phase'].upper()}"
                     time_text = f"Time left: {exercise_status['remaining_time']:.1f}s"
@@ -674,108 +922,77 @@ class HealthMonitor:
                     
                     if exercise_status.get('paused', False):
                         status_text = "PAUSED - Look in correct direction"
-                        status_color = (0, 0, 255)  # Red for paused
+                        status_color = RED  # Red for paused
                     else:
                         status_text = "ACTIVE"
-                        status_color = (0, 255, 0)  # Green for active
+                        status_color = GREEN  # Green for active
                     
-                    cv2.putText(frame, "=== EYE EXERCISE ===", (10, 30), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
-                    cv2.putText(frame, phase_text, (10, 70), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 1, status_color, 2)
+                    self._blit_text(frame, "=== EYE EXERCISE ===", (10, 30), 1, YELLOW, 2)
+                    self._blit_text(frame, phase_text, (10, 70), 1, status_color, 2)
                     cv2.putText(frame, time_text, (10, 110), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
-                    cv2.putText(frame, instruction, (10, 140), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 200), 1)
-                    cv2.putText(frame, status_text, (w - 200, 30), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, status_color, 2)
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.8, WHITE, 2)
+                    self._blit_text(frame, instruction, (10, 140), 0.6, (200, 200, 200), 1)
+                    self._blit_text(frame, status_text, (w - 200, 30), 0.6, status_color, 2)
                     
                     # Draw arrow indicating direction
-                    arrow_x = w // 2
+                    geom = self._arrow_geometry(w, h)
                     if exercise_status['phase'] == 'right':
-                        cv2.arrowedLine(frame, (arrow_x - 100, h//2), (arrow_x + 100, h//2), 
-                                      status_color, 5, tipLength=0.3)
-                        cv2.putText(frame, ">>> LOOK RIGHT >>>", (arrow_x - 150, h//2 - 20), 
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, status_color, 2)
+                        cv2.arrowedLine(frame, geom['west'], geom['east'], status_color, 5, tipLength=0.3)
+                        self._blit_text(frame, ">>> LOOK RIGHT >>>", geom['label'], 0.8, status_color, 2)
                     else:
-                        cv2.arrowedLine(frame, (arrow_x + 100, h//2), (arrow_x - 100, h//2), 
-                                      status_color, 5, tipLength=0.3)
-                        cv2.putText(frame, "<<< LOOK LEFT <<<", (arrow_x - 150, h//2 - 20), 
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, status_color, 2)
+                        cv2.arrowedLine(frame, geom['east'], geom['west'], status_color, 5, tipLength=0.3)
+                        self._blit_text(frame, "<<< LOOK LEFT <<<", geom['label'], 0.8, status_color, 2)
             
             # Regular health status overlay (only if no active exercise)
             elif not self.eye_exercise_active:
-                # Status text
-                status_bg = frame.copy()
-                cv2.rectangle(status_bg, (0, 0), (w, 200), (0, 0, 0), -1)
-                cv2.addWeighted(status_bg, 0.6, frame, 0.4, 0, frame)
+                # Status text background: 60% black, scaled in place like the exercise band
+                band = frame[:200]
+                cv2.convertScaleAbs(band, band, alpha=0.4)
 
                 status_lines = []
                 status_colors = []
 
-                ALERT_COLORS = {
-                    'proximity': (0, 0, 255),      # Red for proximity alerts
-                    'blink_rate': (0, 165, 255),   # Orange for blink rate
-                    'screen_time': (255, 255, 0),  # Cyan for screen time
-                    'posture': (255, 0, 255),      # Magenta for posture
-                    'good': (0, 255, 0),           # Green for good status
-                    'gaze': (255, 255, 255)        # White for gaze info
-                }
-                
-                if results.get('proximity_alert'):
-                    status_lines.append("⚠️ Too close to screen")
-                    status_colors.append(ALERT_COLORS['proximity'])
-                if results.get('low_blink_rate'):
-                    status_lines.append("⚠️ Low blink rate")
-                    status_colors.append(ALERT_COLORS['blink_rate'])
-                if results.get('screen_time_alert'):
-                    status_lines.append("⏰ Time for a break")
-                    status_colors.append(ALERT_COLORS['screen_time'])
-                if results.get('posture', {}).get('is_tilted'):
-                    status_lines.append("⚠️ Head tilted")
-                    status_colors.append(ALERT_COLORS['posture'])
-                if results.get('posture', {}).get('is_slouching'):
-                    status_lines.append("⚠️ Slouching detected")
-                    status_colors.append(ALERT_COLORS['posture'])
+                if prox:
+                    status_lines.append("[!] Too close to screen")
+                    status_colors.append(RED)
+                if low_blink:
+                    status_lines.append("[!] Low blink rate")
+                    status_colors.append(ORANGE)
+                if scr:
+                    status_lines.append("[T] Time for a break")
+                    status_colors.append(CYAN)
+                if tilt:
+                    status_lines.append("[!] Head tilted")
+                    status_colors.append(MAGENTA)
+                if slouch:
+                    status_lines.append("[!] Slouching detected")
+                    status_colors.append(MAGENTA)
                 
                 # Add gaze direction if available
                 if 'gaze_direction' in results:
-                    gaze_map = {'left': '👈 Looking LEFT', 'right': '👉 Looking RIGHT', 'center': '👀 Looking CENTER'}
-                    status_lines.append(gaze_map.get(results['gaze_direction'], '👀 Gaze: Unknown'))
-                    status_colors.append(ALERT_COLORS['gaze'])
-
-                if not any([results.get('proximity_alert'), 
-                       results.get('low_blink_rate'), 
-                       results.get('screen_time_alert'),
-                       results.get('posture', {}).get('is_tilted'),
-                       results.get('posture', {}).get('is_slouching')]):
-                    status_lines.append("✅ All good!")
-                    status_colors.append(ALERT_COLORS['good'])   
+                    status_lines.append(OVERLAY_GAZE_TEXT.get(results['gaze_direction'], 'Gaze: Unknown'))
+                    status_colors.append(WHITE)
+
+                if not (critical or scr):
+                    status_lines.append("[OK] All good!")
+                    status_colors.append(GREEN)   
                 
                 # Display status lines with their respective colors
+                # (the set of possible lines is small, so each is a cached sprite)
                 for i, (line, color) in enumerate(zip(status_lines, status_colors)):
-                    cv2.putText(frame, line, (10, 30 + i*25), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+                    self._blit_text(frame, line, (10, 30 + i*25), 0.6, color, 2)
                     # Add colored dot before each alert
                     cv2.circle(frame, (5, 25 + i*25), 5, color, -1)
             
-            # Add timestamp at bottom
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            cv2.putText(frame, timestamp, (10, h - 10), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.4, (150, 150, 150), 1)   
+            # Add timestamp at bottom (formatted only when the second changes)
+            now_sec = int(time.time())
+            if now_sec != self._last_ts_sec:
+                self._last_ts_sec = now_sec
+                self._last_ts_str = datetime.fromtimestamp(now_sec).strftime("%Y-%m-%d %H:%M:%S")
+            self._blit_text(frame, self._last_ts_str, (10, h - 10), 0.4, (150, 150, 150), 1)
             
             # Add colored border based on overall status
-            border_color = (0, 255, 0)  # Green by default (good)
-            border_thickness = 3
-            if any([results.get('proximity_alert'), 
-                results.get('low_blink_rate'),
-                results.get('posture', {}).get('is_tilted'),
-                results.get('posture', {}).get('is_slouching')]):
-                border_color = (0, 0, 255)  # Red if any critical alerts
-                border_thickness = 5
-            elif results.get('screen_time_alert'):
-                border_color = (255, 255, 0)  # Yellow for screen time warning
-                border_thickness = 4   
+            border_color, border_thickness = BORDER_STYLES[(critical << 1) | (scr and not critical)]
             
             # Draw border around the frame
             cv2.rectangle(frame, (0, 0), (w-1, h-1), border_color, border_thickness) 
@@ -786,10 +1003,11 @@ class HealthMonitor:
         return frame
 
     def save_session_data(self):
-        """Save session data to JSON file"""
+        """Save a full session snapshot to a JSON file (events are already in the session log)"""
         try:
             filename = f"safe_warner_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(filename, 'w') as f:
+            self.flush_session_log()
+            with open(filename, 'w') as f, self._log_lock:
                 json.dump(self.session_data, f, indent=2)
             print(f"Session data saved to {filename}")
             return filename
@@ -807,7 +1025,7 @@ class HealthMonitor:
                 not self.eye_exercise_active,              # No active exercise
                 not any([results.get('posture', {}).get('is_tilted', False),
                         results.get('posture', {}).get('is_slouching', False)]),  # Good posture
-                time.time() - self.session_start > 60      # Minimum session time
+                time.monotonic() - self.session_start > 60      # Minimum session time
             ]
         
             return all(conditions)
@@ -0,0 +1,16 @@
+"""
+Background auto-start status check for Safe Warner
+"""
+from PyQt5.QtCore import QThread, pyqtSignal
+
+class AutoStartCheckThread(QThread):
+    """Thread for querying the auto-start state without blocking the GUI"""
+    result_signal = pyqtSignal(bool)
+    
+    def __init__(self, manager):
+        super().__init__()
+        self.manager = manager
+        
+    def run(self):
+        """Refresh the manager's cached state and report it"""
+        self.result_signal.emit(self.manager.refresh())
\ No newline at end of file
@@ -3,34 +3,46 @@ Main GUI Window for Safe Warner with Auto-Mode System Boot Support
 """
 import time
 from datetime import datetime
-import cv2
 import os
 import json
 from PyQt5.QtWidgets import (QMainWindow, QVBoxLayout, QHBoxLayout, 
                              QPushButton, QLabel, QWidget, QTextEdit, QGroupBox,
                              QProgressBar, QCheckBox, QMessageBox, QSystemTrayIcon, 
-                             QMenu, QAction, QApplication)
+                             QMenu, QAction, QApplication, QStyle)
 from PyQt5.QtCore import QTimer, Qt
-from PyQt5.QtGui import QFont, QImage, QPixmap, QIcon
+from PyQt5.QtGui import QFont, QPixmap, QIcon
 
 from gui.video_thread import VideoThread
+from gui.auto_start_thread import AutoStartCheckThread
 from core.health_monitor import HealthMonitor
 from core.auto_start import AutoStartManager
 
 class SafeWarnerGUI(QMainWindow):
+    # Status refresh periods (ms): fast while something on screen is counting
+    # down or live, slow when the window would only show minute-level changes
+    STATUS_INTERVAL_FAST = 1000
+    STATUS_INTERVAL_SLOW = 10000
+    BACKGROUND_CHECK_INTERVAL = 30  # seconds
+    
+    _tray_icon_image = None  # standard tray QIcon, looked up once
+    
     def __init__(self):
         super().__init__()
         self.monitor = HealthMonitor()
         self.video_thread = None
         self.is_camera_active = False
         self.auto_start_manager = AutoStartManager()
+        self.auto_start_thread = None
+        self._settings = {}
+        self._last_status = {}  # last value pushed to each status widget
         self.auto_mode_active = False
         self.background_mode = False
         self.tray_icon = None
         
         self.init_ui()
         self.setup_timers()
-        self.setup_system_tray()
+        # Deferred so building the tray doesn't hold up the first paint
+        QTimer.singleShot(0, self.setup_system_tray)
         
     def init_ui(self):
         """Initialize the user interface"""
@@ -159,6 +171,7 @@ class SafeWarnerGUI(QMainWindow):
         # Load settings and initialize auto-start checkbox
         self.settings_path = os.path.join(os.getcwd(), "safe_warner_settings.json")
         self.load_settings()
+        self.refresh_auto_start_state()
 
     def toggle_camera(self): 
         if not self.is_camera_active:
@@ -166,20 +179,15 @@ class SafeWarnerGUI(QMainWindow):
         else:
             self.stop_camera()
 
-    def update_camera_feed(self, frame):
-        """Receive frame from thread and display in QLabel"""
+    def update_camera_feed(self):
+        """Paint the newest frame from the video thread, if there is a new one"""
         try:
-            # Convert BGR (OpenCV) to RGB
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_frame.shape
-            bytes_per_line = ch * w
-            qimg = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            self.camera_label.setPixmap(QPixmap.fromImage(qimg).scaled(
-                self.camera_label.width(),
-                self.camera_label.height(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            ))
+            if not self.video_thread:
+                return
+            thread = self.video_thread
+            if thread.frame_pending:
+                self.camera_label.setPixmap(QPixmap.fromImage(thread.frame_buffers[thread.latest_index]))
+                thread.frame_pending = False
         except Exception as e:
             print(f"Error updating camera feed: {e}")
 
@@ -192,18 +200,22 @@ class SafeWarnerGUI(QMainWindow):
         """Start eye exercise via monitor"""
         try:
             self.monitor.start_eye_exercise()
-            self.exercise_status.setText("Exercise: Starting...")
-            self.countdown_bar.setVisible(True)
-            self.countdown_bar.setValue(0)
+            self._update_widget('exercise_text', self.exercise_status.setText, "Exercise: Starting...")
+            self._update_widget('countdown_visible', self.countdown_bar.setVisible, True)
+            self._update_widget('countdown_value', self.countdown_bar.setValue, 0)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not start eye exercise: {e}")
 
     def save_session_data(self):
-        """Save session data and inform the user"""
+        """Save a session snapshot via monitor and inform the user"""
         try:
             filename = self.monitor.save_session_data()
             if filename:
-                QMessageBox.information(self, "Saved", f"Session data saved to {filename}")
+                message = f"Session data saved to {filename}"
+                log_file = self.monitor.flush_session_log()
+                if log_file:
+                    message += f"\nEvent log: {log_file}"
+                QMessageBox.information(self, "Saved", message)
             else:
                 QMessageBox.warning(self, "Warning", "Failed to save session data.")
         except Exception as e:
@@ -214,7 +226,9 @@ class SafeWarnerGUI(QMainWindow):
         if QSystemTrayIcon.isSystemTrayAvailable():
             self.tray_icon = QSystemTrayIcon(self)
             # Use a simple fallback icon to ensure it shows in packaged .exe
-            self.tray_icon.setIcon(self.style().standardIcon(QApplication.style().SP_ComputerIcon))
+            if SafeWarnerGUI._tray_icon_image is None:
+                SafeWarnerGUI._tray_icon_image = self.style().standardIcon(QStyle.SP_ComputerIcon)
+            self.tray_icon.setIcon(SafeWarnerGUI._tray_icon_image)
             
             # Create tray menu
             tray_menu = QMenu()
@@ -241,19 +255,22 @@ class SafeWarnerGUI(QMainWindow):
         # Status update timer
         self.status_timer = QTimer()
         self.status_timer.timeout.connect(self.update_status)
-        self.status_timer.start(1000)  # Update every second
+        self.status_timer.start(self.STATUS_INTERVAL_FAST)  # Re-timed by update_status
         
-        # Auto-mode background timer
-        self.background_timer = QTimer()
-        self.background_timer.timeout.connect(self.check_background_operation)
-        self.background_timer.start(30000)  # Check every 30 seconds
+        # The background-mode check rides on the status timer
+        self._last_bg_check = time.monotonic()
+        
+        # Camera paint timer: repaints at ~30 Hz regardless of camera FPS
+        # (started and stopped with the camera)
+        self.paint_timer = QTimer()
+        self.paint_timer.timeout.connect(self.update_camera_feed)
         
     def start_camera_auto_mode(self):
         """Start camera in auto-mode (system boot)"""
         self.auto_mode_active = True
         self.mode_group.setVisible(False)  # Hide mode controls in auto-mode
         # Delay exercises until first interval completes
-        self.monitor.auto_mode_last_check = time.time()
+        self.monitor.auto_mode_last_check = time.monotonic()
         self.start_camera()
         # Attempt early background switch after a short warm-up
         QTimer.singleShot(3000, self.try_background_after_start)
@@ -276,7 +293,7 @@ class SafeWarnerGUI(QMainWindow):
         """Check if user is at correct distance (simplified implementation)"""
         # TODO: integrate real distance detection; for now allow quick backgrounding
         # Assume OK after short warm-up to let camera initialize and first frames process
-        session_duration = time.time() - self.monitor.session_start
+        session_duration = time.monotonic() - self.monitor.session_start
         return session_duration > 3
         
     def has_active_alerts(self):
@@ -292,6 +309,8 @@ class SafeWarnerGUI(QMainWindow):
         self.background_mode = True
         self.stop_camera()
         self.hide()
+        # hide() sends no hideEvent if the window was never shown
+        self.monitor.draw_enabled = False
         self.show_button.setVisible(True)
         self.background_status.setText("Background: Active")
         self.background_status.setStyleSheet("color: green; font-weight: bold;")
@@ -318,7 +337,7 @@ class SafeWarnerGUI(QMainWindow):
         self.raise_()
         self.activateWindow()
         # Ensure auto-mode allows immediate exercise upon wake
-        self.monitor.auto_mode_last_check = time.time() - self.monitor.auto_mode_interval
+        self.monitor.auto_mode_last_check = time.monotonic() - self.monitor.auto_mode_interval
         self.start_camera()
         self.background_status.setText("Background: Checking...")
         self.background_status.setStyleSheet("color: orange; font-weight: bold;")
@@ -335,6 +354,8 @@ class SafeWarnerGUI(QMainWindow):
             else:
                 # If distance not OK, notify via status text; next timers will re-evaluate
                 self.health_status.append("Distance not ideal. Adjust position.")
+                # The widget no longer holds the cached text; force the next update to redraw it
+                self._last_status.pop('health_status', None)
         except Exception as e:
             print(f"Wake check error: {e}")
 
@@ -388,12 +409,25 @@ class SafeWarnerGUI(QMainWindow):
             self.save_settings({'auto_start_enabled': enabled})
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to update auto-start: {e}")
-            # Revert checkbox to actual state
-            try:
-                current = self.auto_start_manager.is_auto_start_enabled()
-                self.auto_start_checkbox.setChecked(current)
-            except Exception:
-                pass
+            # Revert checkbox to actual state (queried off the GUI thread)
+            self.refresh_auto_start_state()
+
+    def refresh_auto_start_state(self):
+        """Query the OS auto-start state in the background"""
+        if self.auto_start_thread is not None and self.auto_start_thread.isRunning():
+            return
+        self.auto_start_thread = AutoStartCheckThread(self.auto_start_manager)
+        self.auto_start_thread.result_signal.connect(self.on_auto_start_state)
+        self.auto_start_thread.start()
+
+    def on_auto_start_state(self, enabled):
+        """Sync the checkbox with the actual auto-start state"""
+        if self.auto_start_checkbox.isChecked() == enabled:
+            return
+        self.auto_start_checkbox.blockSignals(True)
+        self.auto_start_checkbox.setChecked(enabled)
+        self.auto_start_checkbox.blockSignals(False)
+        self.save_settings({'auto_start_enabled': enabled})
 
     def load_settings(self):
         """Load saved settings and apply to UI"""
@@ -404,6 +438,8 @@ class SafeWarnerGUI(QMainWindow):
                     data = json.load(f)
         except Exception:
             data = {}
+        # In-memory copy; save_settings merges into this instead of re-reading the file
+        self._settings = data
 
         auto_start_enabled = data.get('auto_start_enabled')
         if auto_start_enabled is None:
@@ -413,17 +449,15 @@ class SafeWarnerGUI(QMainWindow):
 
     def save_settings(self, updates: dict):
         """Persist settings to disk"""
-        data = {}
-        try:
-            if os.path.exists(self.settings_path):
-                with open(self.settings_path, 'r') as f:
-                    data = json.load(f)
-        except Exception:
-            data = {}
-        data.update(updates)
+        if all(self._settings.get(key) == value for key, value in updates.items()):
+            return
+        self._settings.update(updates)
+        tmp_path = self.settings_path + '.tmp'
         try:
-            with open(self.settings_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(tmp_path, 'w') as f:
+                json.dump(self._settings, f, indent=2)
+            # Atomic swap: a crash mid-write can't leave a truncated settings file
+            os.replace(tmp_path, self.settings_path)
         except Exception as e:
             print(f"Failed to save settings: {e}")
     
@@ -439,10 +473,15 @@ class SafeWarnerGUI(QMainWindow):
                                   "Please install it using: pip install mediapipe")
                 return
                 
+            # show/hide events don't fire for a window that was never shown
+            # (auto-mode --minimal), so seed the flag from the current state
+            self.monitor.draw_enabled = self.isVisible()
             self.video_thread = VideoThread(self.monitor)
-            self.video_thread.frame_signal.connect(self.update_camera_feed)
+            self.video_thread.display_size = (self.camera_label.width(), self.camera_label.height())
             self.video_thread.results_signal.connect(self.update_health_data)
             self.video_thread.start()
+            self.paint_timer.start(33)
+            self.status_timer.setInterval(self.STATUS_INTERVAL_FAST)
             
             self.is_camera_active = True
             self.camera_button.setText("Stop Camera")
@@ -455,6 +494,7 @@ class SafeWarnerGUI(QMainWindow):
     
     def stop_camera(self):
         """Stop the camera feed"""
+        self.paint_timer.stop()
         if self.video_thread:
             self.video_thread.stop()
             self.video_thread = None
@@ -467,6 +507,19 @@ class SafeWarnerGUI(QMainWindow):
     
     def update_status(self):
         """Update the status display"""
+        now = time.monotonic()
+        if now - self._last_bg_check >= self.BACKGROUND_CHECK_INTERVAL:
+            self._last_bg_check = now
+            self.check_background_operation()
+        
+        # Tick every second only while a countdown or live camera readout is visible
+        next_check = self.monitor.auto_mode_interval - (now - self.monitor.auto_mode_last_check)
+        busy = (self.monitor.eye_exercise_active or self.is_camera_active
+                or (self.monitor.auto_mode and next_check < 60))
+        interval = self.STATUS_INTERVAL_FAST if busy else self.STATUS_INTERVAL_SLOW
+        if self.status_timer.interval() != interval:
+            self.status_timer.setInterval(interval)
+        
         try:
             # Update exercise status
             exercise_status = self.monitor.get_eye_exercise_status()
@@ -477,25 +530,27 @@ class SafeWarnerGUI(QMainWindow):
                 
                 if exercise_status.get('paused', False):
                     status_text += " (PAUSED)"
-                    self.exercise_status.setStyleSheet("color: red; font-weight: bold;")
+                    self._update_widget('exercise_style', self.exercise_status.setStyleSheet,
+                                        "color: red; font-weight: bold;")
                 else:
-                    self.exercise_status.setStyleSheet("color: orange; font-weight: bold;")
+                    self._update_widget('exercise_style', self.exercise_status.setStyleSheet,
+                                        "color: orange; font-weight: bold;")
                 
-                self.exercise_status.setText(status_text)
+                self._update_widget('exercise_text', self.exercise_status.setText, status_text)
                 
                 # Update progress bar
-                self.countdown_bar.setVisible(True)
+                self._update_widget('countdown_visible', self.countdown_bar.setVisible, True)
                 progress = int((15 - time_left) / 15 * 100)
-                self.countdown_bar.setValue(progress)
+                self._update_widget('countdown_value', self.countdown_bar.setValue, progress)
                 
                 # Auto-complete exercise handling
                 if exercise_status.get('exercise_done', False) and self.auto_mode_active:
                     # Exercise completed, prepare to go back to background
                     QTimer.singleShot(5000, self.complete_exercise_cycle)  # Wait 5 seconds
             else:
-                self.exercise_status.setText("No active exercise")
-                self.exercise_status.setStyleSheet("color: black;")
-                self.countdown_bar.setVisible(False)
+                self._update_widget('exercise_text', self.exercise_status.setText, "No active exercise")
+                self._update_widget('exercise_style', self.exercise_status.setStyleSheet, "color: black;")
+                self._update_widget('countdown_visible', self.countdown_bar.setVisible, False)
             
             # Update health status
             status_text = ""
@@ -505,30 +560,38 @@ class SafeWarnerGUI(QMainWindow):
             
             # Add auto-mode info
             if self.monitor.auto_mode:
-                next_check = max(0, self.monitor.auto_mode_interval - (time.time() - self.monitor.auto_mode_last_check))
+                next_check = max(0, self.monitor.auto_mode_interval - (time.monotonic() - self.monitor.auto_mode_last_check))
                 check_min, check_sec = divmod(int(next_check), 60)
-                self.next_check_label.setText(f"Next check: {check_min:02d}:{check_sec:02d}")
+                self._update_widget('next_check', self.next_check_label.setText,
+                                    f"Next check: {check_min:02d}:{check_sec:02d}")
                 
-                session_duration = int((time.time() - self.monitor.session_start) / 60)
+                session_duration = int((time.monotonic() - self.monitor.session_start) / 60)
                 status_text += f"Auto-mode active | Session: {session_duration} min\n"
                 
                 if self.background_mode:
                     status_text += "🔵 Running in background\n"
             else:
-                self.next_check_label.setText("Next check: --:--")
-                session_duration = int((time.time() - self.monitor.session_start) / 60)
+                self._update_widget('next_check', self.next_check_label.setText, "Next check: --:--")
+                session_duration = int((time.monotonic() - self.monitor.session_start) / 60)
                 status_text += f"Manual mode | Session: {session_duration} min\n"
             
             # Update statistics
-            total_alerts = sum(self.monitor.alert_stats.values())
+            total_alerts = self.monitor.alert_total
             exercise_count = len(self.monitor.session_data['eye_exercises'])
-            self.stats_label.setText(f"Alerts: {total_alerts} | Exercises: {exercise_count} | Session: {session_duration}m")
+            self._update_widget('stats', self.stats_label.setText,
+                                f"Alerts: {total_alerts} | Exercises: {exercise_count} | Session: {session_duration}m")
             
-            self.health_status.setText(status_text)
+            self._update_widget('health_status', self.health_status.setText, status_text)
             
         except Exception as e:
             print(f"Error updating status: {e}")
     
+    def _update_widget(self, key, setter, value):
+        """Call a widget setter only when its value differs from the last one set"""
+        if self._last_status.get(key) != value:
+            setter(value)
+            self._last_status[key] = value
+    
     def complete_exercise_cycle(self):
         """Complete the exercise cycle and return to background"""
         if self.auto_mode_active and not self.background_mode:
@@ -547,6 +610,22 @@ class SafeWarnerGUI(QMainWindow):
             
         QApplication.quit()
     
+    def resizeEvent(self, event):
+        """Keep the video thread's output size in step with the camera label"""
+        super().resizeEvent(event)
+        if self.video_thread:
+            self.video_thread.display_size = (self.camera_label.width(), self.camera_label.height())
+
+    def showEvent(self, event):
+        """Resume overlay drawing once the window is visible"""
+        super().showEvent(event)
+        self.monitor.draw_enabled = True
+
+    def hideEvent(self, event):
+        """Nobody sees the overlay while the window is hidden, so stop drawing it"""
+        super().hideEvent(event)
+        self.monitor.draw_enabled = False
+
     def closeEvent(self, event):
         """Handle application close"""
         if self.auto_mode_active and self.background_mode:
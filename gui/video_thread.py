@@ -1,51 +1,182 @@
 """
 Video processing thread for Safe Warner
 """
+import sys
+import threading
 import cv2
 import numpy as np
 from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtGui import QImage
+from utils.constants import CAPTURE_WIDTH, CAPTURE_HEIGHT, CAPTURE_FPS, INFERENCE_STRIDE
 
 class VideoThread(QThread):
     """Thread for handling video processing"""
-    frame_signal = pyqtSignal(np.ndarray)
-    results_signal = pyqtSignal(dict)
+    # Emits the same dict every frame (see _results); copy it to keep a snapshot
+    results_signal = pyqtSignal(object)
+    
+    # The camera paces the loop at its own frame rate
+    if sys.platform == 'win32':
+        CAPTURE_BACKEND = cv2.CAP_DSHOW
+    elif sys.platform.startswith('linux'):
+        CAPTURE_BACKEND = cv2.CAP_V4L2
+    else:
+        CAPTURE_BACKEND = cv2.CAP_ANY
     
     def __init__(self, monitor):
         super().__init__()
         self.monitor = monitor
         self.running = False
         self.cap = None
+        # Single-slot handoff from the capture stage: the reader overwrites it
+        # with each new frame, so processing always starts on the freshest one.
+        # Frames are decoded into a pool of reused buffers and the slot holds a
+        # pool index; with three buffers the reader always has one that is
+        # neither in the slot nor being processed.
+        self._capture_pool = [None] * 3
+        self._latest = None
+        self._processing = None
+        self._latest_cond = threading.Condition()
+        # Reused per-frame results dict, passed as a plain Python object so
+        # the signal doesn't convert it to a QVariantMap on every emit
+        self._results = {}
+        # Metrics move at human timescales, so only every INFERENCE_STRIDE-th
+        # frame is analyzed; the frames in between are drawn with the last results
+        self._frame_ix = 0
+        self._reader = None
+        # Size of the widget the frames are shown in; set from the GUI thread
+        self.display_size = (640, 480)
+        # Two persistent BGR QImages the GUI reads from, plus array views onto
+        # their pixels; the worker fills one while the other is on screen
+        self.frame_buffers = []
+        self._fb_views = []
+        self._fb_index = 0
+        # Latest-wins handoff: the worker publishes a buffer index and sets
+        # frame_pending; the GUI paint timer shows it and clears the flag. While a
+        # frame is pending, newer frames are analyzed but not drawn or published.
+        self.latest_index = 0
+        self.frame_pending = False
         
     def run(self):
         """Main video processing loop"""
-        self.cap = cv2.VideoCapture(0)
+        self.cap = cv2.VideoCapture(0, self.CAPTURE_BACKEND)
         
         if not self.cap.isOpened():
             print("Error: Could not open camera")
             return
+        
+        # Keep only the newest frame in the driver, let the camera compress
+        # over USB and ask for a modest mode instead of the driver default
+        # (often 1080p); not every backend/camera supports these, which is harmless
+        capture_props = (
+            ('MJPG format', cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG')),
+            ('buffer size', cv2.CAP_PROP_BUFFERSIZE, 1),
+            ('frame width', cv2.CAP_PROP_FRAME_WIDTH, CAPTURE_WIDTH),
+            ('frame height', cv2.CAP_PROP_FRAME_HEIGHT, CAPTURE_HEIGHT),
+            ('frame rate', cv2.CAP_PROP_FPS, CAPTURE_FPS),
+        )
+        for name, prop, value in capture_props:
+            if not self.cap.set(prop, value):
+                print(f"Warning: camera did not accept {name} setting")
+        
+        # set() can succeed while the driver picks the nearest supported mode
+        mode = (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                round(self.cap.get(cv2.CAP_PROP_FPS)))
+        if mode != (CAPTURE_WIDTH, CAPTURE_HEIGHT, CAPTURE_FPS):
+            print(f"Warning: camera running at {mode[0]}x{mode[1]} @ {mode[2]} fps "
+                  f"instead of {CAPTURE_WIDTH}x{CAPTURE_HEIGHT} @ {CAPTURE_FPS} fps")
             
         self.running = True
+        # Capture stage: grab and decode frames while the last one is being analyzed
+        self._reader = threading.Thread(target=self._read_frames, daemon=True)
+        self._reader.start()
+        
+        # Processing stage: MediaPipe models stay owned by this thread
         while self.running:
-            ret, frame = self.cap.read()
-            if not ret:
-                continue
+            with self._latest_cond:
+                if self._latest is None:
+                    self._latest_cond.wait(timeout=0.1)
+                if self._latest is None:
+                    continue
+                self._processing, self._latest = self._latest, None
+            frame = self._capture_pool[self._processing]
                 
-            # Process frame
-            results = self.monitor.process_frame(frame)
+            # Process frame (always during an eye exercise, where gaze drives the timer)
+            self._frame_ix += 1
+            if (self._frame_ix % INFERENCE_STRIDE == 0 or not self._results
+                    or self.monitor.eye_exercise_active):
+                results = self.monitor.process_frame(frame, out=self._results)
+            else:
+                results = self._results
             
-            # Draw overlay
-            frame_with_overlay = self.monitor.draw_overlay(frame.copy(), results)
+            # Draw overlay, unless the window is hidden or the GUI hasn't
+            # shown the previous frame yet
+            if self.monitor.draw_enabled and not self.frame_pending:
+                # The frame is ours alone once analyzed, so draw on it in place
+                frame_with_overlay = self.monitor.draw_overlay(frame, results)
+                self.latest_index = self._to_display_image(frame_with_overlay)
+                self.frame_pending = True
             
             # Emit signals
-            self.frame_signal.emit(frame_with_overlay)
             self.results_signal.emit(results)
+        
+        self._reader.join()
             
-            # Small delay to prevent overwhelming the system
-            self.msleep(30)
+    def _allocate_frame_buffers(self, width, height):
+        """(Re)create the two display buffers for a new output size"""
+        buffers, views = [], []
+        for _ in range(2):
+            # Qt reads OpenCV's BGR byte order directly, so no colour conversion is needed
+            qimg = QImage(width, height, QImage.Format_BGR888)
+            ptr = qimg.bits()
+            ptr.setsize(qimg.byteCount())
+            buffers.append(qimg)
+            views.append(np.frombuffer(ptr, np.uint8).reshape(height, width, 3))
+        self._fb_views = views
+        self.frame_buffers = buffers
+        
+    def _to_display_image(self, frame):
+        """Scale a BGR frame to fit display_size into the next frame buffer; returns its index"""
+        h, w = frame.shape[:2]
+        box_w, box_h = self.display_size
+        scale = min(box_w / w, box_h / h)
+        # Keep the width a multiple of 4 so BGR888 rows carry no padding
+        dw = max(4, int(w * scale) & ~3)
+        dh = max(1, int(h * scale))
+        
+        if not self._fb_views or self._fb_views[0].shape[:2] != (dh, dw):
+            self._allocate_frame_buffers(dw, dh)
+        self._fb_index ^= 1
+        target = self._fb_views[self._fb_index]
+        if (dw, dh) != (w, h):
+            cv2.resize(frame, (dw, dh), dst=target, interpolation=cv2.INTER_LINEAR)
+        else:
+            np.copyto(target, frame)
+        return self._fb_index
+        
+    def _read_frames(self):
+        """Capture loop keeping only the newest frame in the handoff slot"""
+        while self.running:
+            # grab() pulls the frame off the device; decode it only once it arrived
+            if not self.cap.grab():
+                continue
+            with self._latest_cond:
+                free = next(i for i in range(len(self._capture_pool))
+                            if i != self._latest and i != self._processing)
+            # Decode straight into the pooled buffer; OpenCV only allocates
+            # when it is missing or the camera resolution changed
+            ret, frame = self.cap.retrieve(self._capture_pool[free])
+            if not ret:
+                continue
+            self._capture_pool[free] = frame
+            with self._latest_cond:
+                # An unprocessed older frame is simply dropped
+                self._latest = free
+                self._latest_cond.notify()
             
     def stop(self):
         """Stop the video thread"""
         self.running = False
+        self.wait()
         if self.cap:
-            self.cap.release()
-        self.wait()
\ No newline at end of file
+            self.cap.release()
\ No newline at end of file
@@ -1,9 +1,18 @@
 # hook-mediapipe.py
+import os
 from PyInstaller.utils.hooks import collect_data_files, collect_dynamic_libs
 
-# Include all mediapipe data files
-datas = collect_data_files('mediapipe')
-binaries = collect_dynamic_libs('mediapipe')
+# Only the graphs (.binarypb) and models (.tflite) behind the two solutions
+# the app uses: FaceMesh (face detection + landmarks) and Pose (detection + landmarks)
+datas = collect_data_files('mediapipe', includes=[
+    'modules/face_detection/*',
+    'modules/face_landmark/*',
+    'modules/pose_detection/*',
+    'modules/pose_landmark/*',
+])
 
-# Also include OpenCV data files if needed
-datas += collect_data_files('cv2')
\ No newline at end of file
+# GPU delegates are never used by the CPU-only build
+binaries = [
+    (src, dest) for src, dest in collect_dynamic_libs('mediapipe')
+    if not any(tag in os.path.basename(src).lower() for tag in ('opencl', 'metal'))
+]
\ No newline at end of file
@@ -2,8 +2,7 @@
 Safe Warner - Main Entry Point
 """
 import sys
-import time
-from gui.main_window import SafeWarnerGUI
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QApplication
 
 def main():
@@ -14,8 +13,14 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("Safe Warner")
     
+    # Imported only once Qt is up: this pulls in OpenCV and MediaPipe, the bulk of startup
+    from gui.main_window import SafeWarnerGUI
+    
     # Create and show the main window
     window = SafeWarnerGUI()
+    # Build and warm up the MediaPipe models off the GUI thread once the
+    # window/tray has had its first paint
+    QTimer.singleShot(0, window.monitor.warmup)
     
     # If starting in auto-mode (system boot), enable special behavior
     if auto_mode:
@@ -30,8 +35,9 @@ def main():
         else:
             window.showMinimized()  # Start minimized
         
-        # Auto-start camera and begin monitoring
-        window.start_camera_auto_mode()
+        # Auto-start camera and begin monitoring once the event loop is running,
+        # so the window/tray come up before the camera opens
+        QTimer.singleShot(0, window.start_camera_auto_mode)
     else:
         # Normal manual startup
         window.show()
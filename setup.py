@@ -13,7 +13,9 @@ setup(
         "mediapipe>=0.10.0",  # Add this line
     ],
     extras_require={
-        'windows': ['pywin32>=300'],
+        'windows': ['pywin32>=300', 'win10toast>=0.9', 'winsdk>=1.0.0b7'],
+        'jit': ['numba>=0.56.0'],  # Optional: JIT for per-frame landmark math
+        'fastjson': ['orjson>=3.6.0'],  # Optional: faster session log serialization
     },
     python_requires=">=3.7",
 )
\ No newline at end of file
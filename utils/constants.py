@@ -1,10 +1,17 @@
 """
 Constants for Safe Warner application
 """
+import numpy as np
 
 # Eye landmarks (MediaPipe Face Mesh indices)
 LEFT_EYE_LANDMARKS = [33, 160, 158, 133, 153, 144]
 RIGHT_EYE_LANDMARKS = [362, 385, 387, 263, 373, 380]
+# Left eye inner/outer, right eye inner/outer, nose tip (gaze estimation)
+GAZE_LANDMARKS = [133, 33, 362, 263, 1]
+# Contiguous int32 copies for single-call vectorized gathers / numba kernels
+LEFT_EYE_LANDMARKS_NP = np.array(LEFT_EYE_LANDMARKS, dtype=np.int32)
+RIGHT_EYE_LANDMARKS_NP = np.array(RIGHT_EYE_LANDMARKS, dtype=np.int32)
+GAZE_LANDMARKS_NP = np.array(GAZE_LANDMARKS, dtype=np.int32)
 
 # Pose landmarks
 NOSE_TIP = 0
@@ -20,33 +27,68 @@ POSTURE_TILT_THRESHOLD = 15
 SLOUCH_THRESHOLD = 0.15
 GAZE_THRESHOLD = 0.2
 
+# Camera capture (requested mode; the driver may fall back to another)
+CAPTURE_WIDTH = 640
+CAPTURE_HEIGHT = 480
+CAPTURE_FPS = 30
+
+# Image processing
+ANALYSIS_SHORT_SIDE = 240  # frames are downscaled to this short side before inference
+INFERENCE_STRIDE = 2  # analyze every Nth camera frame; the others reuse the last results
+POSE_FRAME_STRIDE = 3  # run pose inference on every Nth analyzed frame
+
 # Timing parameters (in seconds)
 BLINK_WINDOW = 10
 SCREEN_TIME_BREAK = 20 * 60  # 20 minutes
 NOTIFICATION_COOLDOWN = 30
 EYE_EXERCISE_DURATION = 15
+SYSTEM_CHECK_INTERVAL = 10  # battery/temperature polling
+VOICE_REPEAT_COOLDOWN = 3  # the same spoken instruction is not repeated within this window
 # For testing, reduce auto-mode interval to 2 minutes
 AUTO_MODE_INTERVAL = 30
 
-# Color codes (BGR format for OpenCV)
+# Logging
+SESSION_LOG_PREFIX = "safe_warner_session_"  # per-session event log: <prefix><start>.jsonl
+
+# Notifications
+# AppUserModelID registered for the app (Start-menu shortcut carrying
+# System.AppUserModel.ID). Native WinRT toasts are only used once this is set;
+# until then win10toast/plyer deliver notifications
+TOAST_APP_ID = None
+
+# Overlay
+TEXT_CACHE_SIZE = 64  # pre-rendered overlay strings kept, least recently used evicted first
+
+# Color codes (BGR format for OpenCV), resolved once at import for the per-frame draw path
+RED = (0, 0, 255)
+GREEN = (0, 255, 0)
+BLUE = (255, 0, 0)
+YELLOW = (0, 255, 255)
+ORANGE = (0, 165, 255)
+MAGENTA = (255, 0, 255)
+CYAN = (255, 255, 0)
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+
+# Deprecated: kept for back-compat, use the named constants above
 COLORS = {
-    'RED': (0, 0, 255),
-    'GREEN': (0, 255, 0),
-    'BLUE': (255, 0, 0),
-    'YELLOW': (0, 255, 255),
-    'ORANGE': (0, 165, 255),
-    'MAGENTA': (255, 0, 255),
-    'CYAN': (255, 255, 0),
-    'WHITE': (255, 255, 255),
-    'BLACK': (0, 0, 0)
+    'RED': RED,
+    'GREEN': GREEN,
+    'BLUE': BLUE,
+    'YELLOW': YELLOW,
+    'ORANGE': ORANGE,
+    'MAGENTA': MAGENTA,
+    'CYAN': CYAN,
+    'WHITE': WHITE,
+    'BLACK': BLACK
 }
 
 # Alert type colors
 ALERT_COLORS = {
-    'proximity': COLORS['RED'],      # Red for proximity alerts
-    'blink_rate': COLORS['ORANGE'],  # Orange for blink rate
-    'screen_time': COLORS['CYAN'],   # Cyan for screen time
-    'posture': COLORS['MAGENTA'],    # Magenta for posture
-    'good': COLORS['GREEN'],         # Green for good status
-    'gaze': COLORS['WHITE']          # White for gaze info
+    'proximity': RED,      # Red for proximity alerts
+    'blink_rate': ORANGE,  # Orange for blink rate
+    'screen_time': CYAN,   # Cyan for screen time
+    'posture': MAGENTA,    # Magenta for posture
+    'good': GREEN,         # Green for good status
+    'gaze': WHITE          # White for gaze info
 }
\ No newline at end of file
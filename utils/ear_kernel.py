@@ -0,0 +1,32 @@
+"""
+Eye Aspect Ratio kernel for blink detection, JIT-compiled with Numba when available
+"""
+import sys
+import math
+
+# Handle optional Numba dependency (JIT for the small per-frame math kernels)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when Numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Numba's on-disk cache needs the source file, which a frozen build doesn't ship
+NUMBA_CACHE = not getattr(sys, 'frozen', False)
+
+
+@njit(cache=NUMBA_CACHE, nogil=True, fastmath=True)
+def ear(lm_xy, idx):
+    """Eye aspect ratio for one eye from (N, 2) landmarks and its 6 landmark indices"""
+    vertical1 = math.hypot(lm_xy[idx[1], 0] - lm_xy[idx[5], 0], lm_xy[idx[1], 1] - lm_xy[idx[5], 1])
+    vertical2 = math.hypot(lm_xy[idx[2], 0] - lm_xy[idx[4], 0], lm_xy[idx[2], 1] - lm_xy[idx[4], 1])
+    horizontal = math.hypot(lm_xy[idx[0], 0] - lm_xy[idx[3], 0], lm_xy[idx[0], 1] - lm_xy[idx[3], 1])
+    if horizontal == 0.0:
+        return 0.0
+    return (vertical1 + vertical2) / (2.0 * horizontal)
\ No newline at end of file
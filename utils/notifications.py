@@ -3,18 +3,38 @@ Notification utilities with fast Windows toast support and cross-platform fallba
 """
 import sys
 import platform
+from xml.sax.saxutils import escape
 
+from utils.constants import TOAST_APP_ID
+
+_win_toast = None  # (ToastNotificationManager, ToastNotification, XmlDocument) from winsdk
+_win_notifiers = {}  # app_id -> cached WinRT toast notifier
 _win_toaster = None
 _plyer = None
 
+_TOAST_XML = ('<toast><visual><binding template="ToastGeneric">'
+              '<text>{title}</text><text>{message}</text>'
+              '</binding></visual></toast>')
+
 def _ensure_backends():
-    global _win_toaster, _plyer
-    if platform.system() == 'Windows' and _win_toaster is None:
-        try:
-            from win10toast import ToastNotifier  # type: ignore
-            _win_toaster = ToastNotifier()
-        except Exception:
-            _win_toaster = None
+    global _win_toast, _win_toaster, _plyer
+    if platform.system() == 'Windows' and _win_toast is None and _win_toaster is None:
+        # Native WinRT toasts: no helper thread or hidden window per notification.
+        # An unpackaged app needs a registered AppUserModelID for them, otherwise
+        # show() silently drops the toast, so they are only used once one is set
+        if TOAST_APP_ID:
+            try:
+                from winsdk.windows.ui.notifications import ToastNotificationManager, ToastNotification  # type: ignore
+                from winsdk.windows.data.xml.dom import XmlDocument  # type: ignore
+                _win_toast = (ToastNotificationManager, ToastNotification, XmlDocument)
+            except Exception:
+                _win_toast = None
+        if _win_toast is None:
+            try:
+                from win10toast import ToastNotifier  # type: ignore
+                _win_toaster = ToastNotifier()
+            except Exception:
+                _win_toaster = None
     if _plyer is None:
         try:
             from plyer import notification as plyer_notification  # type: ignore
@@ -22,23 +42,52 @@ def _ensure_backends():
         except Exception:
             _plyer = None
 
-def fast_notify(title: str, message: str, duration: int = 5, app_id: str = "Safe Warner"):
-    """Send a desktop notification quickly. Returns True if delivered, else False."""
+def _show_winrt_toast(title: str, message: str):
+    manager, toast_cls, xml_cls = _win_toast
+    # The notifier must be created for the registered AUMID, not a display name
+    notifier = _win_notifiers.get(TOAST_APP_ID)
+    if notifier is None:
+        notifier = _win_notifiers[TOAST_APP_ID] = manager.create_toast_notifier(TOAST_APP_ID)
+    xml = xml_cls()
+    xml.load_xml(_TOAST_XML.format(title=escape(title), message=escape(message)))
+    notifier.show(toast_cls(xml))
+
+def _notify_winrt(title, message, duration, app_id):
+    # Display time is up to the OS for WinRT toasts, so duration isn't used
+    _show_winrt_toast(title, message)
+
+def _notify_win10toast(title, message, duration, app_id):
+    _win_toaster.show_toast(title, message, duration=duration, threaded=True)
+
+def _notify_plyer(title, message, duration, app_id):
+    _plyer.notify(title=title, message=message, timeout=duration, app_name=app_id)
+
+_notify_chain = None  # backends in preference order, resolved on the first notification
+
+def _resolve_chain():
+    """Detect the available backends once; the platform doesn't change at runtime"""
+    global _notify_chain
     _ensure_backends()
+    chain = []
     # Prefer Windows toast for speed/reliability in packaged .exe
-    if platform.system() == 'Windows' and _win_toaster is not None:
-        try:
-            _win_toaster.show_toast(title, message, duration=duration, threaded=True)
-            return True
-        except Exception:
-            pass
+    if _win_toast is not None:
+        chain.append(_notify_winrt)
+    if _win_toaster is not None:
+        chain.append(_notify_win10toast)
     # Fallback to plyer if available
     if _plyer is not None:
+        chain.append(_notify_plyer)
+    _notify_chain = tuple(chain)
+    return _notify_chain
+
+def fast_notify(title: str, message: str, duration: int = 5, app_id: str = "Safe Warner"):
+    """Send a desktop notification quickly. Returns True if delivered, else False."""
+    # An empty chain (no backend) is cached too, so test against None
+    chain = _notify_chain if _notify_chain is not None else _resolve_chain()
+    for notify in chain:
         try:
-            _plyer.notify(title=title, message=message, timeout=duration, app_name=app_id)
+            notify(title, message, duration, app_id)
             return True
         except Exception:
             pass
-    return False
-
-
+    return False
\ No newline at end of file
@@ -3,15 +3,27 @@ Lightweight text-to-speech helper for Windows using SAPI.SpVoice.
 No external dependencies beyond pywin32, which is already required on Windows.
 """
 
+import queue
+import threading
+import time
 from typing import Optional
 
+from utils.constants import VOICE_REPEAT_COOLDOWN
+
 try:
+    import pythoncom  # type: ignore
     import win32com.client  # type: ignore
+    from win32com.client import gencache  # type: ignore
     _SAPI_AVAILABLE = True
 except Exception:
     _SAPI_AVAILABLE = False
 
 
+# SpeechVoiceSpeakFlags
+SVSF_ASYNC = 1
+SVSF_PURGE_BEFORE_SPEAK = 2
+
+
 class VoiceGuide:
     """Simple singleton-style TTS wrapper to speak instructions."""
 
@@ -27,30 +39,69 @@ class VoiceGuide:
             return
         self._initialized = True
         self._voice = None
+        # Never block the caller, and let a new instruction cut off a stale one
+        self._flags = SVSF_ASYNC | SVSF_PURGE_BEFORE_SPEAK
+        self._last_text = ""
+        self._last_t = float("-inf")
+        # Callers (the video thread) only enqueue; a dedicated thread owns the
+        # COM object, so they never cross an apartment boundary. Anything
+        # beyond two pending lines is stale by the time it would be spoken.
+        self._q: "queue.Queue[str]" = queue.Queue(maxsize=2)
+        self._worker_thread = None
         if _SAPI_AVAILABLE:
+            self._worker_thread = threading.Thread(target=self._worker, name="voice", daemon=True)
+            self._worker_thread.start()
+
+    def _create_voice(self):
+        """Create the SAPI voice on the calling (worker) thread, or None."""
+        try:
+            try:
+                # Early-bound wrapper: no GetIDsOfNames round-trip per call
+                voice = gencache.EnsureDispatch("SAPI.SpVoice")
+            except Exception:
+                # gen_py cache not writable (e.g. frozen build); fall back to late binding
+                voice = win32com.client.Dispatch("SAPI.SpVoice")
+            # Slightly slower rate improves clarity for instructions
             try:
-                self._voice = win32com.client.Dispatch("SAPI.SpVoice")
-                # Slightly slower rate improves clarity for instructions
+                voice.Rate = -1
+            except Exception:
+                pass
+            return voice
+        except Exception:
+            return None
+
+    def _worker(self) -> None:
+        """Speak queued lines; the only thread that touches COM."""
+        pythoncom.CoInitialize()
+        try:
+            self._voice = self._create_voice()
+            if self._voice is None:
+                return
+            while True:
+                text = self._q.get()
                 try:
-                    self._voice.Rate = -1
+                    self._voice.Speak(text, self._flags)
                 except Exception:
+                    # Silently ignore TTS errors; visual UI remains the source of truth
                     pass
-            except Exception:
-                self._voice = None
+        finally:
+            pythoncom.CoUninitialize()
 
     def speak(self, text: str) -> None:
         """Speak text asynchronously; fail silently if unavailable."""
-        if not text:
+        if not text or self._worker_thread is None:
             return
+        # Drop repeats of the line just spoken before reaching the queue
+        now = time.monotonic()
+        if text == self._last_text and now - self._last_t < VOICE_REPEAT_COOLDOWN:
+            return
+        self._last_text = text
+        self._last_t = now
         try:
-            if self._voice is not None:
-                # Speak asynchronously so we never block UI/video thread
-                self._voice.Speak(text, 1)  # 1 = SVSFlagsAsync
-        except Exception:
-            # Silently ignore TTS errors; visual UI remains the source of truth
+            self._q.put_nowait(text)
+        except queue.Full:
             pass
 
-
 voice = VoiceGuide()
 
 